@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import structlog
 from fastapi import APIRouter, Depends, FastAPI, Request, Response
@@ -14,6 +14,7 @@ from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from rentivo.api.authentication import allow_mfa_setup, delete_legacy_session_cookie
 from rentivo.api.cookies import clear_auth_cookies
 from rentivo.api.errors import Problem, ProblemException, problem, problem_response
+from rentivo.api.offload import monitor_event_loop_lag, shutdown_pools
 from rentivo.api.routes.api_keys import router as api_keys_router
 from rentivo.api.routes.auth import TARPIT_DEADLINE_HEADER
 from rentivo.api.routes.auth import router as auth_router
@@ -30,13 +31,13 @@ from rentivo.api.routes.public import router as public_router
 from rentivo.api.routes.security import router as security_router
 from rentivo.api.routes.themes import router as themes_router
 from rentivo.context import accept_inbound_request_id, new_request_id
-from rentivo.db import get_engine
+from rentivo.db import checkout, get_engine
 from rentivo.encryption.factory import get_encryption
 from rentivo.logging import configure_logging, reconfigure
 from rentivo.observability import configure_tracing
 from rentivo.observability.middleware import TracingMiddleware
 from rentivo.services.container import RequestServices
-from rentivo.settings import validate_production_settings
+from rentivo.settings import settings, validate_production_settings
 
 configure_logging()
 logger = structlog.get_logger(__name__)
@@ -50,7 +51,7 @@ class _LazyServices:
 
     def get(self) -> RequestServices:
         if self._services is None:
-            self._request.state.db_conn = get_engine().connect()
+            self._request.state.db_conn = checkout(get_engine())
             self._services = RequestServices(
                 conn=self._request.state.db_conn,
                 encryption=get_encryption(),
@@ -70,11 +71,21 @@ class _RequestServicesMiddleware:
         request = Request(scope, receive)
         request.state.db_conn = None
         request.state.services = _LazyServices(request)
+
+        def release_db_conn() -> None:
+            conn = request.state.db_conn
+            if conn is not None:
+                request.state.db_conn = None
+                conn.close()
+
+        # Responses that never touch the database while sending (stored-file
+        # downloads) call this at start, so a slow client holds no pooled
+        # connection; streaming bodies and background tasks keep it until the end.
+        request.state.release_db_conn = release_db_conn
         try:
             await self.app(scope, receive, send)
         finally:
-            if request.state.db_conn is not None:
-                request.state.db_conn.close()
+            release_db_conn()
 
 
 async def _tarpit_sleep(seconds: float) -> None:
@@ -218,7 +229,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     configure_tracing()
     reconfigure()
     logger.info("api_application_started")
-    yield
+    lag_monitor: asyncio.Task[None] | None = None
+    if settings.api_loop_lag_interval_seconds > 0:
+        lag_monitor = asyncio.create_task(
+            monitor_event_loop_lag(settings.api_loop_lag_interval_seconds, settings.api_loop_lag_warn_seconds)
+        )
+    try:
+        yield
+    finally:
+        if lag_monitor is not None:
+            lag_monitor.cancel()
+            with suppress(asyncio.CancelledError):
+                await lag_monitor
+        shutdown_pools()
 
 
 def _validation_fields(exc: RequestValidationError) -> dict[str, str]:
@@ -10,8 +10,11 @@ from fastapi.responses import Response
 
 from rentivo.api.dependencies import get_services
 from rentivo.api.errors import ProblemException
+from rentivo.api.offload import RouteClass, run_blocking
 from rentivo.api.principal import Principal
 from rentivo.context import ANON_ACTOR
+from rentivo.models.api_key import APIKey
+from rentivo.models.user import User
 from rentivo.services.container import RequestServices
 from rentivo.settings import settings
 
@@ -120,6 +123,13 @@ def _credential_transport(request: Request) -> tuple[str | None, str | None]:
     return cookie_credential, bearer_credential
 
 
+def _authenticate(services: RequestServices, credential: str) -> tuple[APIKey | None, User | None]:
+    key = services.api_key.authenticate(credential)
+    if key is None:
+        return None, None
+    return key, services.user.get_by_id(key.user_id)
+
+
 async def get_optional_principal(
     request: Request,
     services: RequestServices = Depends(get_services),
@@ -133,11 +143,10 @@ async def get_optional_principal(
         request.state.auth_transport = None
         return None
 
-    key = services.api_key.authenticate(credential)
+    key, user = await run_blocking(RouteClass.READ, _authenticate, services, credential)
     if key is None:
         request.state.clear_auth_cookies = cookie_credential is not None
         raise ProblemException.unauthorized("invalid_credentials", "Credencial inválida ou expirada.")
-    user = services.user.get_by_id(key.user_id)
     if user is None:
         request.state.clear_auth_cookies = cookie_credential is not None
         raise ProblemException.unauthorized("invalid_credentials", "Credencial inválida ou expirada.")
@@ -163,7 +172,7 @@ async def get_optional_principal(
         api_key_uuid=key.uuid,
         api_key_class="login" if key.is_login_token else "integration",
     )
-    enforce_login_mfa(request, principal, services)
+    await run_blocking(RouteClass.READ, enforce_login_mfa, request, principal, services)
     return principal
 
 
@@ -0,0 +1,129 @@
+"""Bounded worker pools for the blocking half of API route handlers.
+
+Route handlers are ``async def`` so they can await form parsing and outbound
+HTTP, but the service stack underneath them is synchronous: PyMySQL queries,
+KMS round-trips, bcrypt, fpdf. Run inline, any one of those stalls every other
+request on the Uvicorn worker's event loop.
+
+With ``RENTIVO_API_OFFLOAD_ENABLED=true``, :func:`run_blocking` hands that work
+to a thread pool sized per :class:`RouteClass`, so a burst of recibo renders
+can only exhaust the ``render`` pool and never starves plain reads. Disabled
+(the default), the callable runs inline on the event loop exactly as before.
+
+:func:`monitor_event_loop_lag` is the matching signal: it measures how late the
+loop wakes up from a fixed sleep, which is precisely the time some handler
+spent blocking it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from typing import ParamSpec, TypeVar
+
+import structlog
+
+from rentivo.observability import set_attributes
+from rentivo.observability.metrics import observe
+from rentivo.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class RouteClass(StrEnum):
+    """Which pool a route's blocking work runs on.
+
+    ``read``: lookups and list/detail pages. ``write``: mutations. ``auth``:
+    credential checks dominated by bcrypt. ``render``: on-demand PDF rendering.
+    """
+
+    READ = "read"
+    WRITE = "write"
+    AUTH = "auth"
+    RENDER = "render"
+
+
+_pools: dict[RouteClass, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _workers(route_class: RouteClass) -> int:
+    return {
+        RouteClass.READ: settings.api_offload_read_workers,
+        RouteClass.WRITE: settings.api_offload_write_workers,
+        RouteClass.AUTH: settings.api_offload_auth_workers,
+        RouteClass.RENDER: settings.api_offload_render_workers,
+    }[route_class]
+
+
+def _pool(route_class: RouteClass) -> ThreadPoolExecutor:
+    pool = _pools.get(route_class)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        pool = _pools.get(route_class)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=_workers(route_class),
+                thread_name_prefix=f"rentivo-api-{route_class.value}",
+            )
+            _pools[route_class] = pool
+    return pool
+
+
+async def run_blocking(route_class: RouteClass, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run ``fn(*args, **kwargs)`` on the ``route_class`` pool and await its result.
+
+    The caller's contextvars (request id, bound log fields, the active span)
+    travel with the call, and exceptions — ``ProblemException`` included —
+    propagate to the awaiting handler unchanged. Context changes made inside
+    ``fn`` do not flow back, so bind log fields on the event-loop side.
+    """
+    if not settings.api_offload_enabled:
+        return fn(*args, **kwargs)
+    context = contextvars.copy_context()
+    call = functools.partial(fn, *args, **kwargs)
+    queued_at = time.perf_counter()
+
+    def run() -> T:
+        waited = time.perf_counter() - queued_at
+        observe("api.offload.queue_wait_seconds", waited, route_class=route_class.value)
+        set_attributes(**{"offload.route_class": route_class.value, "offload.queue_wait_ms": round(waited * 1000, 3)})
+        return call()
+
+    return await asyncio.get_running_loop().run_in_executor(_pool(route_class), context.run, run)
+
+
+def shutdown_pools() -> None:
+    """Drain and drop every pool; the next ``run_blocking`` starts a fresh one."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+async def monitor_event_loop_lag(interval: float, warn_after: float) -> None:
+    """Sample event-loop lag forever; cancel the task to stop it.
+
+    Each sample sleeps ``interval`` seconds and records how much later than
+    that the loop actually resumed. Lag at or above ``warn_after`` is logged as
+    ``event_loop_lag`` so it can be alarmed on from the logs.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - started - interval)
+        observe("api.event_loop.lag_seconds", lag)
+        if lag >= warn_after:
+            logger.warning("event_loop_lag", lag_ms=round(lag * 1000, 1))
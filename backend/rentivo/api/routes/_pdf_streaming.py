@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import Literal
 
 from fastapi.responses import FileResponse, RedirectResponse, Response
+from starlette.types import Receive, Scope, Send
 
 from rentivo.models.bill import Bill
 from rentivo.models.receipt import Receipt
@@ -21,10 +22,21 @@ BillDocument = Literal["invoice", "recibo"]
 _FILENAME_PREFIX: dict[BillDocument, str] = {"invoice": "fatura", "recibo": "recibo"}
 
 
+class DetachedFileResponse(FileResponse):
+    """A ``FileResponse`` that returns the request's pooled DB connection before
+    sending, so a slow download is bounded by bandwidth rather than pool size."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        release = scope.get("state", {}).get("release_db_conn")
+        if release is not None:
+            release()
+        await super().__call__(scope, receive, send)
+
+
 def stored_file_response(ref: FileRef, *, content_type: str, filename: str) -> Response:
     response: Response
     if ref.kind == "local":
-        response = FileResponse(ref.location, media_type=content_type, filename=filename)
+        response = DetachedFileResponse(ref.location, media_type=content_type, filename=filename)
     else:
         response = RedirectResponse(ref.location, status_code=302)
     response.headers["Cache-Control"] = "no-store"
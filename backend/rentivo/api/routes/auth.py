@@ -18,6 +18,7 @@ from rentivo.api.cookies import clear_auth_cookies, client_ip, copy_set_cookies
 from rentivo.api.csrf import issue_csrf_token, require_csrf
 from rentivo.api.dependencies import get_services, require_login_scope
 from rentivo.api.errors import ProblemException, problem
+from rentivo.api.offload import RouteClass, run_blocking
 from rentivo.api.principal import Principal
 from rentivo.api.schemas.auth import (
     AcceptedResponse,
@@ -110,7 +111,9 @@ async def signup(
 ) -> JSONResponse:
     await _verify_turnstile(request, services, payload.turnstile_token)
     try:
-        result = services.login.signup(
+        result = await run_blocking(
+            RouteClass.AUTH,
+            services.login.signup,
             email=payload.email,
             password=payload.password,
             client_ip=client_ip(request),
@@ -144,7 +147,9 @@ async def login(
         raise _login_failure_problem(rate_limited=True)
     try:
         source = "web" if payload.credential_transport == "cookie" else "mobile"
-        result = services.login.login(
+        result = await run_blocking(
+            RouteClass.AUTH,
+            services.login.login,
             email=payload.email,
             password=payload.password,
             client_ip=ip,
@@ -319,7 +324,9 @@ async def mobile_login(
         _charge_mobile_ip_failure(services, ip=ip)
         raise _tarpit(_login_failure_problem(rate_limited=True), deadline=deadline)
     try:
-        result = services.login.login(
+        result = await run_blocking(
+            RouteClass.AUTH,
+            services.login.login,
             email=payload.email,
             password=payload.password,
             client_ip=ip,
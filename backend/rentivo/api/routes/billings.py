@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
 from typing import Literal
 
@@ -15,6 +15,7 @@ from rentivo.api.csrf import require_csrf
 from rentivo.api.dependencies import get_services, require_resource_grant, require_scope
 from rentivo.api.domain_access import BillingAccess, require_role, resolve_billing_access
 from rentivo.api.errors import ProblemException, problem
+from rentivo.api.offload import RouteClass, run_blocking
 from rentivo.api.principal import Principal
 from rentivo.api.routes._pdf_streaming import stored_file_response
 from rentivo.api.schemas.billings import (
@@ -56,6 +57,7 @@ from rentivo.models.billing import Billing, BillingItem, ItemType
 from rentivo.models.billing_attachment import MAX_ATTACHMENT_SIZE, BillingAttachment
 from rentivo.models.communication import CommType, Communication
 from rentivo.models.expense import Expense
+from rentivo.models.organization import Organization
 from rentivo.models.recipient import Recipient
 from rentivo.services.audit_serializers import (
     serialize_billing,
@@ -173,10 +175,16 @@ def _capabilities(access: BillingAccess, *, pix_needs_setup: bool = False) -> Bi
     )
 
 
-def _owner(billing: Billing, services: RequestServices) -> BillingOwnerResponse:
+def _organizations(services: RequestServices, billings: Collection[Billing]) -> dict[int, Organization]:
+    return services.organization.get_many(
+        {billing.owner_id for billing in billings if billing.owner_type == "organization"}
+    )
+
+
+def _owner(billing: Billing, organizations: Mapping[int, Organization]) -> BillingOwnerResponse:
     if billing.owner_type != "organization":
         return BillingOwnerResponse(type="user")
-    organization = services.organization.get_by_id(billing.owner_id)
+    organization = organizations.get(billing.owner_id)
     return BillingOwnerResponse(
         type="organization",
         uuid=organization.uuid if organization is not None else None,
@@ -234,21 +242,28 @@ def _visible_accesses(
     principal: Principal,
     services: RequestServices,
     billings: Collection[Billing],
-) -> list[BillingAccess]:
-    accesses: list[BillingAccess] = []
-    for billing in billings:
-        if billing.id is None:
-            continue
-        if not services.api_key.can_access_resource(
-            principal.api_key,
-            billing.owner_type,
-            billing.owner_id,
-        ):
-            continue
-        role = services.authorization.get_role_for_billing(principal.user.id, billing)
-        if role is not None:
-            accesses.append(BillingAccess(billing=billing, role=role, principal=principal))
-    return accesses
+) -> tuple[list[BillingAccess], dict[int, Organization]]:
+    """Bulk ``can_access_resource`` + ``get_role_for_billing`` over ``billings``.
+
+    Grants are checked in memory; the caller's organization roles and the live
+    owning organizations each come from one query, so the cost stays constant
+    however many billings the user can see. The organizations are returned for
+    rendering owners.
+    """
+    granted = [
+        billing
+        for billing in billings
+        if billing.id is not None
+        and services.api_key.grants_resource(principal.api_key, billing.owner_type, billing.owner_id)
+    ]
+    roles = services.authorization.get_roles_for_billings(principal.user.id, granted)
+    organizations = _organizations(services, [billing for billing in granted if billing.id in roles])
+    accesses = [
+        BillingAccess(billing=billing, role=roles[billing.id], principal=principal)
+        for billing in granted
+        if billing.id in roles and (billing.owner_type != "organization" or billing.owner_id in organizations)
+    ]
+    return accesses, organizations
 
 
 def _contact_rows(items: tuple[ContactInput, ...]) -> list[dict[str, str]]:
@@ -343,6 +358,7 @@ def _billing_response(access: BillingAccess, services: RequestServices) -> Billi
     billing_id = billing.id
     assert billing_id is not None
     templates = tuple(services.communication.resolve_template(billing, comm_type.value) for comm_type in CommType)
+    pix_needs_setup = services.pix.billing_needs_setup(billing)
     return BillingResponse(
         uuid=billing.uuid,
         name=billing.name,
@@ -350,7 +366,7 @@ def _billing_response(access: BillingAccess, services: RequestServices) -> Billi
         pix_key=billing.pix_key,
         pix_merchant_name=billing.pix_merchant_name,
         pix_merchant_city=billing.pix_merchant_city,
-        owner=_owner(billing, services),
+        owner=_owner(billing, _organizations(services, [billing])),
         items=tuple(_item(item) for item in billing.items),
         recipients=tuple(
             _contact(recipient, access.principal) for recipient in services.recipient.list_for_billing(billing_id)
@@ -367,13 +383,17 @@ def _billing_response(access: BillingAccess, services: RequestServices) -> Billi
             for template in templates
         ),
         stats=BillingStatsResponse.from_stats(services.billing_stats.stats_for_ids([billing_id])),
-        pix_needs_setup=services.pix.billing_needs_setup(billing),
-        capabilities=_capabilities(access, pix_needs_setup=services.pix.billing_needs_setup(billing)),
+        pix_needs_setup=pix_needs_setup,
+        capabilities=_capabilities(access, pix_needs_setup=pix_needs_setup),
         created_at=billing.created_at,
         updated_at=billing.updated_at,
     )
 
 
+def _billing_detail(principal: Principal, services: RequestServices, billing_uuid: str) -> BillingResponse:
+    return _billing_response(resolve_billing_access(principal, services, billing_uuid), services)
+
+
 class _BillingItemReferenceError(ValueError):
     def __init__(self, field: str, message: str) -> None:
         super().__init__(message)
@@ -410,40 +430,45 @@ def _billing_items(
     return result
 
 
-@router.get("", response_model=BillingListResponse)
-async def list_billings(
-    principal: Principal = Depends(_billings_read),
-    services: RequestServices = Depends(get_services),
-) -> BillingListResponse:
-    accesses = _visible_accesses(
+def _billing_list(principal: Principal, services: RequestServices) -> BillingListResponse:
+    accesses, organizations = _visible_accesses(
         principal,
         services,
         services.billing.list_billings_for_user(principal.user.id),
     )
+    services.pix.prime_organizations(organizations.values())
     billing_ids = [access.billing.id for access in accesses]
     stats = services.billing_stats.stats_for_ids(billing_ids)
-    return BillingListResponse(
-        items=tuple(
+    items = []
+    for access in accesses:
+        pix_needs_setup = services.pix.billing_needs_setup(access.billing)
+        items.append(
             BillingListItemResponse(
                 uuid=access.billing.uuid,
                 name=access.billing.name,
                 description=access.billing.description,
-                owner=_owner(access.billing, services),
+                owner=_owner(access.billing, organizations),
                 item_count=len(access.billing.items),
-                pix_needs_setup=services.pix.billing_needs_setup(access.billing),
+                pix_needs_setup=pix_needs_setup,
                 current_bill=_current_bill(stats, access.billing.id),
-                capabilities=_capabilities(
-                    access,
-                    pix_needs_setup=services.pix.billing_needs_setup(access.billing),
-                ),
+                capabilities=_capabilities(access, pix_needs_setup=pix_needs_setup),
             )
-            for access in accesses
-        ),
+        )
+    return BillingListResponse(
+        items=tuple(items),
         user_pix_incomplete=services.pix.owner_needs_setup("user", principal.user.id),
         stats=BillingStatsResponse.from_stats(stats),
     )
 
 
+@router.get("", response_model=BillingListResponse)
+async def list_billings(
+    principal: Principal = Depends(_billings_read),
+    services: RequestServices = Depends(get_services),
+) -> BillingListResponse:
+    return await run_blocking(RouteClass.READ, _billing_list, principal, services)
+
+
 def _create_owner(
     payload: BillingCreateRequest,
     principal: Principal,
@@ -509,7 +534,7 @@ async def get_billing(
     principal: Principal = Depends(_billings_read),
     services: RequestServices = Depends(get_services),
 ) -> BillingResponse:
-    return _billing_response(resolve_billing_access(principal, services, billing_uuid), services)
+    return await run_blocking(RouteClass.READ, _billing_detail, principal, services, billing_uuid)
 
 
 @router.patch("/{billing_uuid}", response_model=BillingResponse)
@@ -25,11 +25,13 @@ from rentivo.api.csrf import require_csrf
 from rentivo.api.dependencies import get_services, require_scope
 from rentivo.api.domain_access import (
     BillAccess,
+    BillingAccess,
     require_role,
     resolve_bill_access,
     resolve_billing_access,
 )
 from rentivo.api.errors import Problem, ProblemException
+from rentivo.api.offload import RouteClass, run_blocking
 from rentivo.api.principal import Principal
 from rentivo.api.routes._pdf_streaming import (
     bill_pdf_filename,
@@ -469,48 +471,45 @@ async def _upload_receipts(
     return response
 
 
+def _bill_list(principal: Principal, services: RequestServices, billing_uuid: str) -> BillListResponse:
+    access = resolve_billing_access(principal, services, billing_uuid)
+    bills = services.bill.list_bills(access.billing.id)
+    return BillListResponse(items=tuple(_bill_response(access.for_bill(bill), services) for bill in bills))
+
+
 @router.get("", response_model=BillListResponse, responses={404: {"model": Problem}})
 async def list_bills(
     billing_uuid: str,
     principal: Principal = Depends(_bills_read),
     services: RequestServices = Depends(get_services),
 ) -> BillListResponse:
-    access = resolve_billing_access(principal, services, billing_uuid)
-    bills = services.bill.list_bills(access.billing.id)
-    return BillListResponse(items=tuple(_bill_response(access.for_bill(bill), services) for bill in bills))
+    return await run_blocking(RouteClass.READ, _bill_list, principal, services, billing_uuid)
 
 
-@router.post(
-    "",
-    response_model=BillDetailResponse,
-    status_code=201,
-    responses={403: {"model": Problem}, 404: {"model": Problem}, 409: {"model": Problem}, 422: {"model": Problem}},
-    openapi_extra=_BILL_CREATE_OPENAPI,
-)
-async def create_bill(
-    request: Request,
+def _bill_create_access(
+    principal: Principal,
+    services: RequestServices,
     billing_uuid: str,
-    response: Response,
-    payload: Annotated[str | BillCreateRequest | None, Form()] = None,
-    receipt_files: Annotated[list[BrowserUploadFile] | None, File()] = None,
-    principal: Principal = Depends(_bills_write),
-    _csrf: None = Depends(require_csrf),
-    services: RequestServices = Depends(get_services),
-) -> BillDetailResponse:
+    *,
+    with_receipts: bool,
+) -> BillingAccess:
     access = resolve_billing_access(principal, services, billing_uuid)
     require_role(access.role, _MANAGE_ROLES)
-    if receipt_files and not principal.has_scope(APIScope.FILES_WRITE):
+    if with_receipts and not principal.has_scope(APIScope.FILES_WRITE):
         raise ProblemException.forbidden("missing_scope", "A chave não possui o escopo necessário.")
     _require_pix(access.billing, services)
-    create = await _create_request(request, cast(str | None, payload))
-    required_variable_uuids = {item.uuid for item in access.billing.items if item.item_type == ItemType.VARIABLE}
-    if set(create.variable_amounts) != required_variable_uuids:
-        raise ProblemException.invalid_field(
-            "invalid_variable_amounts",
-            "Informe o valor de todos os itens variáveis.",
-            "variable_amounts",
-        )
-    valid_uploads, skipped_reasons = await _validate_receipt_uploads(receipt_files or ())
+    return access
+
+
+def _create_bill(
+    access: BillingAccess,
+    services: RequestServices,
+    create: BillCreateRequest,
+    valid_uploads: Sequence[_ValidatedReceiptUpload],
+    skipped_reasons: Sequence[str],
+    response: Response,
+) -> BillDetailResponse:
+    principal = access.principal
     try:
         bill = services.bill.generate_bill(
             billing=access.billing,
@@ -569,6 +568,45 @@ async def create_bill(
     )
 
 
+@router.post(
+    "",
+    response_model=BillDetailResponse,
+    status_code=201,
+    responses={403: {"model": Problem}, 404: {"model": Problem}, 409: {"model": Problem}, 422: {"model": Problem}},
+    openapi_extra=_BILL_CREATE_OPENAPI,
+)
+async def create_bill(
+    request: Request,
+    billing_uuid: str,
+    response: Response,
+    payload: Annotated[str | BillCreateRequest | None, Form()] = None,
+    receipt_files: Annotated[list[BrowserUploadFile] | None, File()] = None,
+    principal: Principal = Depends(_bills_write),
+    _csrf: None = Depends(require_csrf),
+    services: RequestServices = Depends(get_services),
+) -> BillDetailResponse:
+    access = await run_blocking(
+        RouteClass.READ,
+        _bill_create_access,
+        principal,
+        services,
+        billing_uuid,
+        with_receipts=bool(receipt_files),
+    )
+    create = await _create_request(request, cast(str | None, payload))
+    required_variable_uuids = {item.uuid for item in access.billing.items if item.item_type == ItemType.VARIABLE}
+    if set(create.variable_amounts) != required_variable_uuids:
+        raise ProblemException.invalid_field(
+            "invalid_variable_amounts",
+            "Informe o valor de todos os itens variáveis.",
+            "variable_amounts",
+        )
+    valid_uploads, skipped_reasons = await _validate_receipt_uploads(receipt_files or ())
+    return await run_blocking(
+        RouteClass.WRITE, _create_bill, access, services, create, valid_uploads, skipped_reasons, response
+    )
+
+
 @router.get("/{bill_uuid}", response_model=BillDetailResponse, responses={404: {"model": Problem}})
 async def get_bill(
     billing_uuid: str,
@@ -794,7 +832,7 @@ async def download_recibo(
     principal: Principal = Depends(_files_read),
     services: RequestServices = Depends(get_services),
 ) -> Response:
-    access = resolve_bill_access(principal, services, billing_uuid, bill_uuid)
+    access = await run_blocking(RouteClass.READ, resolve_bill_access, principal, services, billing_uuid, bill_uuid)
     _require_recibo_released(access.bill)
     if is_rendering(access.bill):
         raise _recibo_not_ready()
@@ -802,11 +840,9 @@ async def download_recibo(
     if has_recibo(access.bill):
         response = stream_bill_pdf(access.bill, services, kind="recibo")
     else:
-        response = rendered_pdf_response(
-            bytes(services.bill.render_recibo(access.bill, access.billing)),
-            filename=bill_pdf_filename(access.bill, kind="recibo"),
-        )
-    _audit_recibo_download(access, services)
+        content = await run_blocking(RouteClass.RENDER, services.bill.render_recibo, access.bill, access.billing)
+        response = rendered_pdf_response(bytes(content), filename=bill_pdf_filename(access.bill, kind="recibo"))
+    await run_blocking(RouteClass.WRITE, _audit_recibo_download, access, services)
     set_analytics(
         response,
         "rentivo_recibo_downloaded",
@@ -8,18 +8,30 @@ an optional ``endpoint_url`` override used by LocalStack-style stacks.
 This module owns that single seam. It deliberately knows nothing about the
 backends themselves, so the storage/email/encryption factories and protocols
 stay untouched.
+
+Building a client loads the botocore service model and opens a fresh
+connection pool, which dominates the latency of a small job. The backends
+therefore go through :func:`shared_client`, a process-wide registry that hands
+every caller with the same (service, region, endpoint, credentials) the same
+client. boto3 clients are thread-safe once built; only construction is
+serialized.
 """
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
+from rentivo.settings import settings
+
 try:
     import boto3
+    from botocore.config import Config
 except ImportError:  # pragma: no cover
     boto3 = None  # type: ignore[assignment]
+    Config = None  # type: ignore[assignment,misc]
 
-__all__ = ["build_client"]
+__all__ = ["build_client", "shared_client"]
 
 # All AWS integrations ship in the same optional dependency group.
 _EXTRA = "s3"
@@ -34,13 +46,15 @@ def build_client(
     endpoint_url: str = "",
     feature: str,
     note: str = "",
+    max_pool_connections: int | None = None,
 ) -> Any:
-    """Return a boto3 client for ``service``.
+    """Return a new boto3 client for ``service``.
 
     ``feature`` names the caller in the missing-dependency error (for example
     ``"S3 storage"``), and ``note`` appends an optional trailing sentence to
     that same message. ``endpoint_url`` is only forwarded when non-empty so
-    boto3 keeps resolving the regional endpoint by default.
+    boto3 keeps resolving the regional endpoint by default, and
+    ``max_pool_connections`` likewise only when given.
     """
     if boto3 is None:
         message = f"boto3 is required for {feature}. Install it with: pip install rentivo[{_EXTRA}]"
@@ -56,4 +70,54 @@ def build_client(
     }
     if endpoint_url:
         client_kwargs["endpoint_url"] = endpoint_url
+    if max_pool_connections is not None:
+        client_kwargs["config"] = Config(max_pool_connections=max_pool_connections)
     return boto3.client(**client_kwargs)
+
+
+_clients: dict[tuple[str, str, str, str, str], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def shared_client(
+    service: str,
+    *,
+    region: str,
+    access_key_id: str,
+    secret_access_key: str,
+    endpoint_url: str = "",
+    feature: str,
+    note: str = "",
+) -> Any:
+    """Return the process-wide boto3 client for this service/region/endpoint/credentials.
+
+    The first caller builds it through :func:`build_client` with
+    ``RENTIVO_AWS_MAX_POOL_CONNECTIONS``; every later caller with the same key
+    gets that instance back. A missing boto3 raises exactly as
+    :func:`build_client` does, and nothing is cached.
+    """
+    key = (service, region, endpoint_url, access_key_id, secret_access_key)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = build_client(
+                service,
+                region=region,
+                access_key_id=access_key_id,
+                secret_access_key=secret_access_key,
+                endpoint_url=endpoint_url,
+                feature=feature,
+                note=note,
+                max_pool_connections=settings.aws_max_pool_connections,
+            )
+            _clients[key] = client
+    return client
+
+
+def _reset_for_tests() -> None:
+    """Drop every shared client so the next caller builds (and mocks) afresh."""
+    with _clients_lock:
+        _clients.clear()
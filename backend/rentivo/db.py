@@ -1,11 +1,17 @@
 import os
+import time
+from typing import Any
 
 import structlog
 from alembic.config import Config
-from sqlalchemy import Connection, create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import Connection, create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
 
 from alembic import command
+from rentivo.observability import set_attributes
+from rentivo.observability.metrics import increment, observe, set_gauge
 from rentivo.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -14,15 +20,87 @@ _engine: Engine | None = None
 _connection: Connection | None = None
 
 
+def _pool_options() -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds or -1,
+    }
+    # SQLite (tests, local tooling) runs on a single-connection pool that takes
+    # none of the QueuePool sizing arguments.
+    if make_url(settings.db_url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_pool_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_use_lifo=settings.db_pool_lifo,
+        )
+    return options
+
+
+def _record_pool_levels(pool: QueuePool, in_use: int) -> None:
+    set_gauge("db.pool.in_use", in_use)
+    set_gauge("db.pool.overflow", max(0, in_use - pool.size()))
+
+
+def instrument_pool(engine: Engine) -> None:
+    """Publish in-use and overflow levels of ``engine``'s QueuePool as gauges.
+
+    ``db.pool.overflow`` is how many checked-out connections sit beyond
+    ``db_pool_size``, and every connection opened past it bumps the
+    ``db.pool.overflow_connections`` counter. Other pool classes are ignored.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+    set_gauge("db.pool.size", pool.size())
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        if pool.overflow() > 0:
+            increment("db.pool.overflow_connections")
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        _record_pool_levels(pool, pool.checkedout())
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        # Fires before the pool takes the connection back.
+        _record_pool_levels(pool, pool.checkedout() - 1)
+
+
+def checkout(engine: Engine) -> Connection:
+    """``engine.connect()``, recording how long the pool made the caller wait.
+
+    The wait (``db.pool.checkout_wait_seconds``) covers queueing for a free
+    connection plus any pre-ping or reconnect, and lands on the current span
+    next to the pool levels, so a starved pool shows up as checkout time rather
+    than as slow SQL. A checkout that times out is counted and logged as
+    ``db_pool_exhausted`` before the error propagates.
+    """
+    started = time.perf_counter()
+    try:
+        conn = engine.connect()
+    except PoolTimeoutError:
+        increment("db.pool.checkout_timeouts")
+        logger.warning("db_pool_exhausted", timeout_seconds=settings.db_pool_timeout_seconds)
+        raise
+    waited = time.perf_counter() - started
+    observe("db.pool.checkout_wait_seconds", waited)
+    attributes: dict[str, Any] = {"db.pool.checkout_wait_ms": round(waited * 1000, 3)}
+    if isinstance(engine.pool, QueuePool):
+        attributes["db.pool.in_use"] = engine.pool.checkedout()
+        attributes["db.pool.overflow"] = max(0, engine.pool.checkedout() - engine.pool.size())
+    set_attributes(**attributes)
+    return conn
+
+
 def get_engine() -> Engine:
     global _engine
     if _engine is None:
-        _engine = create_engine(
-            settings.db_url,
-            pool_pre_ping=True,
-            pool_recycle=1800,
-        )
+        _engine = create_engine(settings.db_url, **_pool_options())
         logger.info("db_engine_created")
+        instrument_pool(_engine)
         # Emit a span per SQL statement when tracing is on (no-op otherwise).
         from rentivo.observability import instrument_sqlalchemy
 
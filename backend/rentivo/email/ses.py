@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import structlog
 
-from rentivo.aws import build_client
+from rentivo.aws import shared_client
 from rentivo.email.base import EmailBackend, EmailMessage
 from rentivo.email.mime import build_mime
 from rentivo.observability import traced
@@ -22,7 +22,7 @@ class SESEmailBackend(EmailBackend):
     ) -> None:
         self.from_address = from_address
         self.configuration_set = configuration_set
-        self.client = build_client(
+        self.client = shared_client(
             "ses",
             region=region,
             access_key_id=access_key_id,
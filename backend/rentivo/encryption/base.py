@@ -35,6 +35,27 @@ class EncryptionBackend(ABC):
         """True iff ``value`` has the ciphertext shape this backend produces."""
         ...
 
+    def is_current(self, value: str) -> bool:
+        """True iff ``value`` is already in the format new writes use.
+
+        Defaults to :meth:`is_encrypted`. A backend that reads several
+        ciphertext formats but writes only one overrides this, so the backfill
+        can tell rows to migrate from rows already done.
+        """
+        return self.is_encrypted(value)
+
+    @traced("encryption.encrypt_many")
+    def encrypt_many(self, plaintexts: list[str]) -> list[str]:
+        """Encrypt a batch of values, returning ciphertexts in the same order.
+
+        The write-side counterpart of :meth:`decrypt_many`: repository write
+        paths gather every field of a row (and of its child rows) into one
+        call. Default implementation calls ``encrypt`` sequentially; backends
+        with a network round-trip per value override it to parallelise.
+        """
+        set_attributes(count=len(plaintexts))
+        return [self.encrypt(v) for v in plaintexts]
+
     @traced("encryption.decrypt_many")
     def decrypt_many(self, values: list[str]) -> list[str]:
         """Decrypt a batch of values, returning plaintexts in the same order.
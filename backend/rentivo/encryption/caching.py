@@ -21,9 +21,15 @@ class CachingEncryptionBackend(EncryptionBackend):
     def encrypt(self, plaintext: str) -> str:
         return self.inner.encrypt(plaintext)
 
+    def encrypt_many(self, plaintexts: list[str]) -> list[str]:
+        return self.inner.encrypt_many(plaintexts)
+
     def is_encrypted(self, value: str) -> bool:
         return self.inner.is_encrypted(value)
 
+    def is_current(self, value: str) -> bool:
+        return self.inner.is_current(value)
+
     def decrypt(self, value: str) -> str:
         hit = self.cache.get_many([value])
         if value in hit:
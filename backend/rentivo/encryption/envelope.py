@@ -0,0 +1,134 @@
+"""``enc:v2`` envelope format: AES-256-GCM under a KMS-wrapped data key.
+
+Ciphertext format: ``enc:v2:<base64(wrapped data key)>:<base64(nonce || ciphertext+tag)>``.
+
+Every ``enc:v1`` field costs one KMS ``Decrypt`` round-trip on read. Under
+``enc:v2`` KMS only ever sees the 32-byte data key: one ``GenerateDataKey``
+per key rotation on the write side and one ``Decrypt`` per distinct wrapped
+key on the read side. :class:`DataKeyCache` keeps both directions in process
+memory, bounded by age and (for encryption) by how many values a key seals,
+so a warm process reads bills, billings, and users without calling KMS.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+V2_PREFIX = "enc:v2:"
+_NONCE_BYTES = 12
+# Binds every sealed value to this format, so a v2 payload can't be replayed
+# under some other scheme that happens to share the key.
+_AAD = b"rentivo:enc:v2"
+
+
+@dataclass(slots=True)
+class _EncryptKey:
+    plaintext: bytes
+    wrapped: bytes
+    created_at: float
+    uses: int = 0
+
+
+class DataKeyCache:
+    """In-process store of plaintext data keys, both directions.
+
+    ``generate`` returns ``(plaintext, wrapped)`` for a fresh data key (KMS
+    ``GenerateDataKey``); ``unwrap`` turns a wrapped key back into plaintext
+    (KMS ``Decrypt``). The encrypt key is rotated after ``max_age_seconds`` or
+    ``max_uses`` seals, whichever comes first. Unwrapped keys expire after the
+    same age and are evicted least-recently-used beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        *,
+        generate: Callable[[], tuple[bytes, bytes]],
+        unwrap: Callable[[bytes], bytes],
+        max_age_seconds: float,
+        max_uses: int,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._generate = generate
+        self._unwrap = unwrap
+        self.max_age_seconds = max_age_seconds
+        self.max_uses = max_uses
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._current: _EncryptKey | None = None
+        self._unwrapped: OrderedDict[bytes, tuple[bytes, float]] = OrderedDict()
+
+    def for_encrypt(self) -> tuple[bytes, bytes]:
+        """Return ``(plaintext, wrapped)`` of the key to seal the next value with."""
+        with self._lock:
+            now = self._clock()
+            current = self._current
+            if current is None or current.uses >= self.max_uses or now - current.created_at >= self.max_age_seconds:
+                plaintext, wrapped = self._generate()
+                current = self._current = _EncryptKey(plaintext, wrapped, now)
+                self._remember(wrapped, plaintext, now)
+            current.uses += 1
+            return current.plaintext, current.wrapped
+
+    def cached(self, wrapped: bytes) -> bytes | None:
+        """The plaintext for ``wrapped`` if it is cached and fresh, else None."""
+        with self._lock:
+            entry = self._unwrapped.get(wrapped)
+            if entry is None:
+                return None
+            plaintext, stored_at = entry
+            if self._clock() - stored_at >= self.max_age_seconds:
+                del self._unwrapped[wrapped]
+                return None
+            self._unwrapped.move_to_end(wrapped)
+            return plaintext
+
+    def for_decrypt(self, wrapped: bytes) -> bytes:
+        """Return the plaintext for ``wrapped``, unwrapping through KMS on a miss.
+
+        The KMS call runs outside the lock, so a cold burst may unwrap the same
+        key more than once; the results are identical and the last one wins.
+        """
+        plaintext = self.cached(wrapped)
+        if plaintext is not None:
+            return plaintext
+        plaintext = self._unwrap(wrapped)
+        with self._lock:
+            self._remember(wrapped, plaintext, self._clock())
+        return plaintext
+
+    def _remember(self, wrapped: bytes, plaintext: bytes, now: float) -> None:
+        self._unwrapped[wrapped] = (plaintext, now)
+        self._unwrapped.move_to_end(wrapped)
+        while len(self._unwrapped) > self.max_entries:
+            self._unwrapped.popitem(last=False)
+
+
+def wrapped_key(value: str) -> bytes:
+    """The KMS-wrapped data key embedded in an ``enc:v2`` value."""
+    encoded_key, _, _ = value[len(V2_PREFIX) :].partition(":")
+    return base64.b64decode(encoded_key)
+
+
+def seal(plaintext: str, key: bytes, wrapped: bytes) -> str:
+    nonce = os.urandom(_NONCE_BYTES)
+    sealed = AESGCM(key).encrypt(nonce, plaintext.encode("utf-8"), _AAD)
+    return (
+        V2_PREFIX + base64.b64encode(wrapped).decode("ascii") + ":" + base64.b64encode(nonce + sealed).decode("ascii")
+    )
+
+
+def open_sealed(value: str, key: bytes) -> str:
+    _, _, encoded_payload = value[len(V2_PREFIX) :].partition(":")
+    payload = base64.b64decode(encoded_payload)
+    nonce, sealed = payload[:_NONCE_BYTES], payload[_NONCE_BYTES:]
+    return AESGCM(key).decrypt(nonce, sealed, _AAD).decode("utf-8")
@@ -21,13 +21,22 @@ def _build_inner_backend() -> EncryptionBackend:
     if backend == "kms":
         from rentivo.encryption.kms import KMSBackend
 
-        logger.info("encryption_backend_selected", backend="kms", key_id=settings.kms_key_id)
+        logger.info(
+            "encryption_backend_selected",
+            backend="kms",
+            key_id=settings.kms_key_id,
+            envelope=settings.kms_envelope_enabled,
+        )
         return KMSBackend(
             key_id=settings.kms_key_id,
             region=settings.kms_region,
             access_key_id=settings.kms_access_key_id,
             secret_access_key=settings.kms_secret_access_key,
             endpoint_url=settings.kms_endpoint_url,
+            envelope=settings.kms_envelope_enabled,
+            data_key_max_age_seconds=settings.kms_data_key_max_age_seconds,
+            data_key_max_uses=settings.kms_data_key_max_uses,
+            data_key_cache_entries=settings.kms_data_key_cache_entries,
         )
     raise ValueError(f"Unsupported encryption backend: {backend}")
 
@@ -1,33 +1,79 @@
 from __future__ import annotations
 
 import base64
+import functools
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import structlog
 
-from rentivo.aws import build_client
+from rentivo.aws import shared_client
 from rentivo.encryption.base import EncryptionBackend
+from rentivo.encryption.envelope import V2_PREFIX, DataKeyCache, open_sealed, seal, wrapped_key
+from rentivo.encryption.limiter import AdaptiveLimiter
 from rentivo.observability import set_attributes, traced
+from rentivo.observability.metrics import increment, observe, set_gauge
+from rentivo.settings import settings
 
 logger = structlog.get_logger(__name__)
 
 _PREFIX = "enc:v1:"
 _BASE64_PREFIX = "b64:v1:"  # transitional read-compat: see decrypt()
-_DECRYPT_MANY_MAX_WORKERS = 16
+_THROTTLE_CODE = "ThrottlingException"
+_THROTTLE_RETRIES = 3
+_THROTTLE_BACKOFF_SECONDS = 0.05
+
+# One pool and one in-flight cap per process, shared by every KMSBackend: the
+# KMS request quota is per account and region, not per request or instance.
+_pool: ThreadPoolExecutor | None = None
+_limiter: AdaptiveLimiter | None = None
+_shared_lock = threading.Lock()
+
+
+def _shared() -> tuple[ThreadPoolExecutor, AdaptiveLimiter]:
+    global _pool, _limiter
+    with _shared_lock:
+        if _pool is None or _limiter is None:
+            _pool = ThreadPoolExecutor(max_workers=settings.kms_max_in_flight, thread_name_prefix="rentivo-kms")
+            _limiter = AdaptiveLimiter(settings.kms_max_in_flight)
+        return _pool, _limiter
+
+
+def _is_throttle(exc: Exception) -> bool:
+    response = getattr(exc, "response", None)
+    return isinstance(response, dict) and response.get("Error", {}).get("Code") == _THROTTLE_CODE
+
+
+def _reset_for_tests() -> None:
+    """Drop the shared pool and limiter so the next call rebuilds them from settings."""
+    global _pool, _limiter
+    with _shared_lock:
+        pool, _pool, _limiter = _pool, None, None
+    if pool is not None:
+        pool.shutdown(wait=True)
 
 
 class KMSBackend(EncryptionBackend):
-    """AWS KMS direct-encryption backend.
+    """AWS KMS encryption backend.
+
+    Two ciphertext formats, both always readable:
 
-    Ciphertext format: ``enc:v1:<base64(KMS CiphertextBlob)>``.
+    - ``enc:v1:<base64(KMS CiphertextBlob)>`` — direct KMS ``Encrypt``. Every
+      read is one KMS ``Decrypt`` round-trip.
+    - ``enc:v2:...`` — envelope encryption (see :mod:`rentivo.encryption.envelope`):
+      AES-GCM under a KMS-wrapped data key held in a local :class:`DataKeyCache`,
+      so a warm process reads without calling KMS at all.
 
-    Direct KMS (rather than envelope encryption) is used because the values are
-    small (PIX keys, merchant names, TOTP secrets — all well under KMS's 4 KB
-    plaintext limit) and the read-volume profile does not justify the extra
-    moving parts. If read volume grows, a future v2 ciphertext format can layer
-    in per-row data-encryption keys with a local cache.
+    ``envelope`` picks the format new writes use. Either way an already-encrypted
+    value passes through ``encrypt`` unchanged; :meth:`is_current` is what tells
+    the backfill which rows still need rewriting into the active format.
     """
 
+    envelope: bool = False
+    _data_keys: DataKeyCache | None = None
+
     def __init__(
         self,
         key_id: str,
@@ -35,9 +81,15 @@ class KMSBackend(EncryptionBackend):
         access_key_id: str,
         secret_access_key: str,
         endpoint_url: str = "",
+        *,
+        envelope: bool = False,
+        data_key_max_age_seconds: int = 300,
+        data_key_max_uses: int = 10_000,
+        data_key_cache_entries: int = 1024,
     ) -> None:
         self.key_id = key_id
-        self.client = build_client(
+        self.envelope = envelope
+        self.client = shared_client(
             "kms",
             region=region,
             access_key_id=access_key_id,
@@ -46,13 +98,46 @@ class KMSBackend(EncryptionBackend):
             feature="KMS encryption",
             note="(the s3 extras group also provides the boto3 client used for KMS).",
         )
+        self._data_keys = self._build_data_keys(data_key_max_age_seconds, data_key_max_uses, data_key_cache_entries)
+
+    def _build_data_keys(self, max_age_seconds: int, max_uses: int, max_entries: int) -> DataKeyCache:
+        return DataKeyCache(
+            generate=self._generate_data_key,
+            unwrap=self._unwrap_data_key,
+            max_age_seconds=max_age_seconds,
+            max_uses=max_uses,
+            max_entries=max_entries,
+        )
+
+    def _keys(self) -> DataKeyCache:
+        if self._data_keys is None:
+            self._data_keys = self._build_data_keys(300, 10_000, 1024)
+        return self._data_keys
+
+    def _generate_data_key(self) -> tuple[bytes, bytes]:
+        response = self._call("generate_data_key", KeyId=self.key_id, KeySpec="AES_256")
+        logger.debug("encryption_data_key_generated", backend="kms")
+        return response["Plaintext"], response["CiphertextBlob"]
+
+    def _unwrap_data_key(self, wrapped: bytes) -> bytes:
+        response = self._call("decrypt", CiphertextBlob=wrapped, KeyId=self.key_id)
+        logger.debug("encryption_data_key_unwrapped", backend="kms")
+        return response["Plaintext"]
 
     def encrypt(self, plaintext: str) -> str:
+        return self._encrypt(plaintext)
+
+    def _encrypt(self, plaintext: str, queued_at: float | None = None) -> str:
         if plaintext == "":
             return ""
         if self.is_encrypted(plaintext):
             return plaintext
-        response = self.client.encrypt(
+        if self.envelope:
+            key, wrapped = self._keys().for_encrypt()
+            return seal(plaintext, key, wrapped)
+        response = self._call(
+            "encrypt",
+            queued_at=queued_at,
             KeyId=self.key_id,
             Plaintext=plaintext.encode("utf-8"),
         )
@@ -61,7 +146,44 @@ class KMSBackend(EncryptionBackend):
         logger.debug("encryption_encrypted", backend="kms", bytes=len(blob))
         return _PREFIX + encoded
 
+    def _call(self, operation: str, *, queued_at: float | None = None, **kwargs: Any) -> dict:
+        """Run one KMS ``operation`` under the shared in-flight cap.
+
+        Queue wait (from ``queued_at``, or from now, until a slot is free) and
+        the KMS round-trip are recorded separately. A ``ThrottlingException``
+        shrinks the cap and is retried with exponential backoff; any other
+        error, or a throttle on the last attempt, propagates.
+        """
+        _, limiter = _shared()
+        attempt = 0
+        while True:
+            waiting_since = time.perf_counter() if queued_at is None else queued_at
+            limiter.acquire()
+            started = time.perf_counter()
+            observe("kms.queue_wait_seconds", started - waiting_since, operation=operation)
+            try:
+                response = getattr(self.client, operation)(**kwargs)
+            except Exception as exc:
+                throttled = _is_throttle(exc)
+                limiter.release(throttled=throttled)
+                set_gauge("kms.concurrency_limit", limiter.limit)
+                if not throttled or attempt >= _THROTTLE_RETRIES:
+                    raise
+                increment("kms.throttled", operation=operation)
+                logger.warning("kms_throttled", operation=operation, attempt=attempt + 1, limit=limiter.limit)
+                time.sleep(_THROTTLE_BACKOFF_SECONDS * 2**attempt)
+                attempt += 1
+                queued_at = None
+                continue
+            observe("kms.rtt_seconds", time.perf_counter() - started, operation=operation)
+            limiter.release()
+            set_gauge("kms.concurrency_limit", limiter.limit)
+            return response
+
     def decrypt(self, value: str) -> str:
+        return self._decrypt(value)
+
+    def _decrypt(self, value: str, queued_at: float | None = None) -> str:
         if value == "":
             return ""
         if value.startswith(_BASE64_PREFIX):
@@ -69,17 +191,42 @@ class KMSBackend(EncryptionBackend):
             # Decode locally without calling KMS so reads stay correct until the
             # backfill rewrites the row as enc:v1.
             return base64.b64decode(value[len(_BASE64_PREFIX) :]).decode("utf-8")
-        if not self.is_encrypted(value):
+        if value.startswith(V2_PREFIX):
+            return open_sealed(value, self._keys().for_decrypt(wrapped_key(value)))
+        if not value.startswith(_PREFIX):
             return value
         encoded = value[len(_PREFIX) :]
         blob = base64.b64decode(encoded)
-        response = self.client.decrypt(CiphertextBlob=blob, KeyId=self.key_id)
+        response = self._call("decrypt", queued_at=queued_at, CiphertextBlob=blob, KeyId=self.key_id)
         plaintext: bytes = response["Plaintext"]
         logger.debug("encryption_decrypted", backend="kms", bytes=len(plaintext))
         return plaintext.decode("utf-8")
 
     def is_encrypted(self, value: str) -> bool:
-        return value.startswith(_PREFIX)
+        return value.startswith((_PREFIX, V2_PREFIX))
+
+    def is_current(self, value: str) -> bool:
+        if self.envelope:
+            return value.startswith(V2_PREFIX)
+        return self.is_encrypted(value)
+
+    @traced("kms.encrypt_many")
+    def encrypt_many(self, plaintexts: list[str]) -> list[str]:
+        if not plaintexts:
+            return []
+        set_attributes(count=len(plaintexts))
+        # Envelope mode seals locally (at most one GenerateDataKey for the
+        # batch); direct mode fans the per-value Encrypt RTTs out on the shared
+        # pool so a row with N encrypted fields costs ~one RTT, not N.
+        pending = [index for index, value in enumerate(plaintexts) if value and not self.is_encrypted(value)]
+        if self.envelope or len(pending) < 2:
+            return [self._encrypt(value) for value in plaintexts]
+        pool, _ = _shared()
+        queued_at = time.perf_counter()
+        sealed = dict(
+            zip(pending, pool.map(lambda index: self._encrypt(plaintexts[index], queued_at), pending), strict=True)
+        )
+        return [sealed.get(index, value) for index, value in enumerate(plaintexts)]
 
     @traced("kms.decrypt_many")
     def decrypt_many(self, values: list[str]) -> list[str]:
@@ -88,7 +235,21 @@ class KMSBackend(EncryptionBackend):
         set_attributes(count=len(values))
         # Boto3 KMS clients are thread-safe; fan out the per-value Decrypt RTTs
         # so a list page with N×M encrypted columns finishes in ~max RTT
-        # instead of N×M × RTT.
-        max_workers = min(_DECRYPT_MANY_MAX_WORKERS, len(values))
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            return list(pool.map(self.decrypt, values))
+        # instead of N×M × RTT. The pool and the in-flight cap are process-wide,
+        # so concurrent requests share one KMS budget instead of each bringing
+        # its own threads. v2 values need KMS only for data keys not yet
+        # cached — once per distinct key, not per value — and are then opened
+        # locally.
+        keys = self._keys()
+        direct = [index for index, value in enumerate(values) if value.startswith(_PREFIX)]
+        cold = {wrapped_key(value) for value in values if value.startswith(V2_PREFIX)}
+        cold = {wrapped for wrapped in cold if keys.cached(wrapped) is None}
+        opened: dict[int, str] = {}
+        if direct or cold:
+            pool, _ = _shared()
+            queued_at = time.perf_counter()
+            tasks = [functools.partial(self._decrypt, values[index], queued_at) for index in direct]
+            tasks += [functools.partial(keys.for_decrypt, wrapped) for wrapped in cold]
+            results = list(pool.map(lambda task: task(), tasks))
+            opened = dict(zip(direct, results[: len(direct)], strict=True))
+        return [opened[index] if index in opened else self._decrypt(value) for index, value in enumerate(values)]
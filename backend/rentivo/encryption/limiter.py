@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class AdaptiveLimiter:
+    """AIMD cap on concurrent calls to a rate-limited service.
+
+    Every caller takes a slot with ``acquire()`` and gives it back with
+    ``release()``. The cap starts at ``max_limit``; a throttled release halves
+    it (at most once per ``cooldown_seconds``, so one burst of throttles from
+    calls that were already in flight counts once), and each run of ``limit``
+    clean releases raises it by one, back up to ``max_limit``.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        cooldown_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("AdaptiveLimiter needs 1 <= min_limit <= max_limit")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._limit = max_limit
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease: float | None = None
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block until a slot is free under the current cap, then take it."""
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, *, throttled: bool = False) -> None:
+        """Give the slot back, adjusting the cap by how the call went."""
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                now = self._clock()
+                if self._last_decrease is None or now - self._last_decrease >= self.cooldown_seconds:
+                    self._limit = max(self.min_limit, self._limit // 2)
+                    self._last_decrease = now
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self._limit and self._limit < self.max_limit:
+                    self._limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
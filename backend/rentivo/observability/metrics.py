@@ -0,0 +1,96 @@
+"""In-process metrics registry: counters, gauges, and duration summaries.
+
+Traces answer "why was this request slow"; these answer "how often, and how
+bad, across every request this process served". Values live in process memory
+only — nothing is exported on its own. Readers take a :func:`snapshot`, and
+the hot spots that need alerting also log a structured event, which CloudWatch
+metric filters already consume.
+
+Label values must be low-cardinality, non-PII strings (a job type, a route
+class, a pool name) — never ids, emails, or anything user-supplied.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True)
+class _Summary:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+
+_lock = threading.Lock()
+_counters: dict[_Key, float] = {}
+_gauges: dict[_Key, float] = {}
+_summaries: dict[_Key, _Summary] = {}
+
+
+def _key(name: str, labels: dict[str, Any]) -> _Key:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def increment(name: str, value: float = 1, **labels: Any) -> None:
+    """Add ``value`` to the counter ``name`` for this label set."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def set_gauge(name: str, value: float, **labels: Any) -> None:
+    """Record the current level of ``name`` (in-use connections, queue depth)."""
+    key = _key(name, labels)
+    with _lock:
+        _gauges[key] = value
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    """Fold one sample (usually seconds) into the ``name`` summary."""
+    key = _key(name, labels)
+    with _lock:
+        summary = _summaries.get(key)
+        if summary is None:
+            summary = _summaries[key] = _Summary()
+        summary.add(value)
+
+
+def snapshot() -> dict[str, list[dict[str, Any]]]:
+    """A point-in-time copy of every series, grouped by kind."""
+    with _lock:
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value} for (name, labels), value in _counters.items()
+            ],
+            "gauges": [
+                {"name": name, "labels": dict(labels), "value": value} for (name, labels), value in _gauges.items()
+            ],
+            "summaries": [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": summary.count,
+                    "sum": summary.total,
+                    "max": summary.max,
+                }
+                for (name, labels), summary in _summaries.items()
+            ],
+        }
+
+
+def _reset_for_tests() -> None:
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _summaries.clear()
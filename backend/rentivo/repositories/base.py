@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from datetime import datetime
 
 from rentivo.models.api_key import APIKey, APIKeyGrant
@@ -276,6 +277,10 @@ class OrganizationRepository(ABC):
     @abstractmethod
     def list_by_user(self, user_id: int) -> list[Organization]: ...
 
+    @abstractmethod
+    def list_by_ids(self, org_ids: Collection[int]) -> list[Organization]:
+        """Live organizations among ``org_ids``, in one query."""
+
     @abstractmethod
     def update(self, org: Organization) -> Organization: ...
 
@@ -297,6 +302,10 @@ class OrganizationRepository(ABC):
     @abstractmethod
     def list_members(self, org_id: int) -> list[OrganizationMember]: ...
 
+    @abstractmethod
+    def list_memberships_for_user(self, user_id: int) -> list[OrganizationMember]:
+        """Every membership row of ``user_id``, across organizations, in one query."""
+
     @abstractmethod
     def update_member_role(self, org_id: int, user_id: int, role: str) -> None: ...
 
@@ -80,6 +80,9 @@ class SQLAlchemyBillRepository(BillRepository):
     def create(self, bill: Bill) -> Bill:
         bill_uuid = str(ULID())
         now = _now()
+        notes, *descriptions = self.encryption.encrypt_many(
+            [bill.notes, *(item.description for item in bill.line_items)]
+        )
         try:
             result = self.conn.execute(
                 text(
@@ -93,7 +96,7 @@ class SQLAlchemyBillRepository(BillRepository):
                     "reference_month": bill.reference_month,
                     "total_amount": bill.total_amount,
                     "pdf_path": bill.pdf_path,
-                    "notes": self.encryption.encrypt(bill.notes),
+                    "notes": notes,
                     "uuid": bill_uuid,
                     "due_date": bill.due_date,
                     "status": bill.status,
@@ -102,28 +105,66 @@ class SQLAlchemyBillRepository(BillRepository):
                 },
             )
             bill_id = result.lastrowid
-            for i, item in enumerate(bill.line_items):
-                self.conn.execute(
-                    text(
-                        "INSERT INTO bill_line_items (bill_id, description, amount, item_type, sort_order) "
-                        "VALUES (:bill_id, :description, :amount, :item_type, :sort_order)"
-                    ),
-                    {
-                        "bill_id": bill_id,
-                        "description": self.encryption.encrypt(item.description),
-                        "amount": item.amount,
-                        "item_type": item.item_type.value,
-                        "sort_order": i,
-                    },
-                )
-            created = self.get_by_id(bill_id)
-            if created is None:
-                raise RuntimeError(f"Failed to retrieve bill after create (id={bill_id})")
+            line_item_ids = self._insert_line_items(bill_id, bill.line_items, descriptions)
             self.conn.commit()
         except Exception:
             self.conn.rollback()
             raise
-        return created
+        # Every column is already in hand: the returned model is the plaintext we
+        # just encrypted plus the generated keys, with no re-read and no decrypt.
+        return bill.model_copy(
+            update={
+                "id": bill_id,
+                "uuid": bill_uuid,
+                "line_items": self._written_line_items(bill_id, bill.line_items, line_item_ids),
+                "recibo_pdf_path": None,
+                "status_updated_at": now,
+                "pdf_render_status": None,
+                "mutation_revision": 0,
+                "created_at": now,
+                "deleted_at": None,
+            }
+        )
+
+    def _insert_line_items(self, bill_id: int, line_items: list[BillLineItem], descriptions: list[str]) -> list[int]:
+        """Insert ``line_items`` in one multi-row statement and return their ids.
+
+        ``executemany`` does not report per-row ids, so they come back from one
+        plain ``SELECT`` in ``sort_order`` — no ciphertext is read.
+        """
+        if not line_items:
+            return []
+        self.conn.execute(
+            text(
+                "INSERT INTO bill_line_items (bill_id, description, amount, item_type, sort_order) "
+                "VALUES (:bill_id, :description, :amount, :item_type, :sort_order)"
+            ),
+            [
+                {
+                    "bill_id": bill_id,
+                    "description": description,
+                    "amount": item.amount,
+                    "item_type": item.item_type.value,
+                    "sort_order": i,
+                }
+                for i, (item, description) in enumerate(zip(line_items, descriptions, strict=True))
+            ],
+        )
+        return list(
+            self.conn.execute(
+                text("SELECT id FROM bill_line_items WHERE bill_id = :bill_id ORDER BY sort_order"),
+                {"bill_id": bill_id},
+            ).scalars()
+        )
+
+    @staticmethod
+    def _written_line_items(
+        bill_id: int, line_items: list[BillLineItem], line_item_ids: list[int]
+    ) -> list[BillLineItem]:
+        return [
+            item.model_copy(update={"id": item_id, "bill_id": bill_id, "sort_order": i})
+            for i, (item, item_id) in enumerate(zip(line_items, line_item_ids, strict=True))
+        ]
 
     def _build_bill(
         self,
@@ -271,46 +312,51 @@ class SQLAlchemyBillRepository(BillRepository):
 
     @traced("bill_repo.update")
     def update(self, bill: Bill) -> Bill:
+        if bill.id is None:  # pragma: no cover
+            raise ValueError("Cannot update bill without an id")
         self.conn.rollback()
-        self.conn.execute(
-            text(
-                "UPDATE bills SET reference_month = :reference_month, "
-                "total_amount = :total_amount, notes = :notes, due_date = :due_date, "
-                "mutation_revision = mutation_revision + 1 WHERE id = :id"
-            ),
-            {
-                "reference_month": bill.reference_month,
-                "total_amount": bill.total_amount,
-                "notes": self.encryption.encrypt(bill.notes),
-                "due_date": bill.due_date,
-                "id": bill.id,
-            },
-        )
-        self.conn.execute(
-            text("DELETE FROM bill_line_items WHERE bill_id = :bill_id"),
-            {"bill_id": bill.id},
+        notes, *descriptions = self.encryption.encrypt_many(
+            [bill.notes, *(item.description for item in bill.line_items)]
         )
-        for i, item in enumerate(bill.line_items):
+        try:
             self.conn.execute(
                 text(
-                    "INSERT INTO bill_line_items (bill_id, description, amount, item_type, sort_order) "
-                    "VALUES (:bill_id, :description, :amount, :item_type, :sort_order)"
+                    "UPDATE bills SET reference_month = :reference_month, "
+                    "total_amount = :total_amount, notes = :notes, due_date = :due_date, "
+                    "mutation_revision = mutation_revision + 1 WHERE id = :id"
                 ),
                 {
-                    "bill_id": bill.id,
-                    "description": self.encryption.encrypt(item.description),
-                    "amount": item.amount,
-                    "item_type": item.item_type.value,
-                    "sort_order": i,
+                    "reference_month": bill.reference_month,
+                    "total_amount": bill.total_amount,
+                    "notes": notes,
+                    "due_date": bill.due_date,
+                    "id": bill.id,
                 },
             )
-        self.conn.commit()
-        if bill.id is None:  # pragma: no cover
-            raise ValueError("Cannot update bill without an id")
-        result = self.get_by_id(bill.id)
-        if result is None:
-            raise RuntimeError(f"Failed to retrieve bill after update (id={bill.id})")
-        return result
+            self.conn.execute(
+                text("DELETE FROM bill_line_items WHERE bill_id = :bill_id"),
+                {"bill_id": bill.id},
+            )
+            line_item_ids = self._insert_line_items(bill.id, bill.line_items, descriptions)
+            # Only the unencrypted columns (status, paths, the bumped revision)
+            # are read back; notes and descriptions come from the plaintext input.
+            row = (
+                self.conn.execute(
+                    text("SELECT * FROM bills WHERE id = :id AND deleted_at IS NULL"),
+                    {"id": bill.id},
+                )
+                .mappings()
+                .fetchone()
+            )
+            if row is None:
+                raise RuntimeError(f"Failed to retrieve bill after update (id={bill.id})")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        updated = self._build_bill(row, [], iter([bill.notes]))
+        updated.line_items = self._written_line_items(bill.id, bill.line_items, line_item_ids)
+        return updated
 
     @traced("bill_repo.update_pdf_path")
     def update_pdf_path(self, bill_id: int, pdf_path: str) -> None:
@@ -637,6 +683,9 @@ class SQLAlchemyBillRepository(BillRepository):
                 self.conn.commit()
                 return False
 
+            notes, *descriptions = self.encryption.encrypt_many(
+                [previous.notes, *(item.description for item in previous.line_items)]
+            )
             result = self.conn.execute(
                 text(
                     "UPDATE bills SET reference_month = :reference_month, "
@@ -650,7 +699,7 @@ class SQLAlchemyBillRepository(BillRepository):
                     **params,
                     "reference_month": previous.reference_month,
                     "total_amount": previous.total_amount,
-                    "notes": self.encryption.encrypt(previous.notes),
+                    "notes": notes,
                     "due_date": previous.due_date,
                     "pdf_path": previous.pdf_path,
                     "pdf_render_status": previous.pdf_render_status,
@@ -664,7 +713,7 @@ class SQLAlchemyBillRepository(BillRepository):
                 text("DELETE FROM bill_line_items WHERE bill_id = :bill_id"),
                 {"bill_id": previous.id},
             )
-            for index, item in enumerate(previous.line_items):
+            for index, (item, description) in enumerate(zip(previous.line_items, descriptions, strict=True)):
                 self.conn.execute(
                     text(
                         "INSERT INTO bill_line_items "
@@ -673,7 +722,7 @@ class SQLAlchemyBillRepository(BillRepository):
                     ),
                     {
                         "bill_id": previous.id,
-                        "description": self.encryption.encrypt(item.description),
+                        "description": description,
                         "amount": item.amount,
                         "item_type": item.item_type.value,
                         "sort_order": index,
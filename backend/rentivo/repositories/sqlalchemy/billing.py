@@ -26,6 +26,18 @@ class SQLAlchemyBillingRepository(BillingRepository):
     def _insert_billing(self, billing: Billing) -> int:
         billing_uuid = str(ULID())
         now = _now()
+        name, description, pix_key, pix_merchant_name, pix_merchant_city, *item_descriptions = (
+            self.encryption.encrypt_many(
+                [
+                    billing.name,
+                    billing.description,
+                    billing.pix_key,
+                    billing.pix_merchant_name,
+                    billing.pix_merchant_city,
+                    *(item.description for item in billing.items),
+                ]
+            )
+        )
         result = self.conn.execute(
             text(
                 "INSERT INTO billings (name, description, pix_key, pix_merchant_name, pix_merchant_city, "
@@ -34,11 +46,11 @@ class SQLAlchemyBillingRepository(BillingRepository):
                 ":uuid, :owner_type, :owner_id, :created_at, :updated_at)"
             ),
             {
-                "name": self.encryption.encrypt(billing.name),
-                "description": self.encryption.encrypt(billing.description),
-                "pix_key": self.encryption.encrypt(billing.pix_key),
-                "pix_merchant_name": self.encryption.encrypt(billing.pix_merchant_name),
-                "pix_merchant_city": self.encryption.encrypt(billing.pix_merchant_city),
+                "name": name,
+                "description": description,
+                "pix_key": pix_key,
+                "pix_merchant_name": pix_merchant_name,
+                "pix_merchant_city": pix_merchant_city,
                 "uuid": billing_uuid,
                 "owner_type": billing.owner_type,
                 "owner_id": billing.owner_id,
@@ -47,7 +59,7 @@ class SQLAlchemyBillingRepository(BillingRepository):
             },
         )
         billing_id = int(result.lastrowid)
-        for i, item in enumerate(billing.items):
+        for i, (item, item_description) in enumerate(zip(billing.items, item_descriptions, strict=True)):
             self.conn.execute(
                 text(
                     "INSERT INTO billing_items (billing_id, uuid, description, amount, item_type, sort_order) "
@@ -56,7 +68,7 @@ class SQLAlchemyBillingRepository(BillingRepository):
                 {
                     "billing_id": billing_id,
                     "uuid": item.uuid,
-                    "description": self.encryption.encrypt(item.description),
+                    "description": item_description,
                     "amount": item.amount,
                     "item_type": item.item_type.value,
                     "sort_order": i,
@@ -81,14 +93,17 @@ class SQLAlchemyBillingRepository(BillingRepository):
             raise ValueError("Unsupported billing contact table")
         self.conn.execute(delete_statement, {"bid": billing_id})
         now = _now()
+        ciphertexts = self.encryption.encrypt_many(
+            [value for recipient in recipients for value in (recipient.name, recipient.email)]
+        )
         for index, recipient in enumerate(recipients):
             self.conn.execute(
                 insert_statement,
                 {
                     "uuid": str(ULID()),
                     "billing_id": billing_id,
-                    "name": self.encryption.encrypt(recipient.name),
-                    "email": self.encryption.encrypt(recipient.email),
+                    "name": ciphertexts[2 * index],
+                    "email": ciphertexts[2 * index + 1],
                     "sort_order": index,
                     "created_at": now,
                 },
@@ -284,12 +299,24 @@ class SQLAlchemyBillingRepository(BillingRepository):
     ) -> bool:
         if billing.id is None:
             raise ValueError("Cannot update billing without an id")
+        name, description, pix_key, pix_merchant_name, pix_merchant_city, *item_descriptions = (
+            self.encryption.encrypt_many(
+                [
+                    billing.name,
+                    billing.description,
+                    billing.pix_key,
+                    billing.pix_merchant_name,
+                    billing.pix_merchant_city,
+                    *(item.description for item in billing.items),
+                ]
+            )
+        )
         values = {
-            "name": self.encryption.encrypt(billing.name),
-            "description": self.encryption.encrypt(billing.description),
-            "pix_key": self.encryption.encrypt(billing.pix_key),
-            "pix_merchant_name": self.encryption.encrypt(billing.pix_merchant_name),
-            "pix_merchant_city": self.encryption.encrypt(billing.pix_merchant_city),
+            "name": name,
+            "description": description,
+            "pix_key": pix_key,
+            "pix_merchant_name": pix_merchant_name,
+            "pix_merchant_city": pix_merchant_city,
             "updated_at": _now(),
             "id": billing.id,
         }
@@ -315,7 +342,7 @@ class SQLAlchemyBillingRepository(BillingRepository):
         if result.rowcount != 1:
             return False
         self.conn.execute(text("DELETE FROM billing_items WHERE billing_id=:billing_id"), {"billing_id": billing.id})
-        for index, item in enumerate(billing.items):
+        for index, (item, item_description) in enumerate(zip(billing.items, item_descriptions, strict=True)):
             self.conn.execute(
                 text(
                     "INSERT INTO billing_items (billing_id, uuid, description, amount, item_type, sort_order) "
@@ -324,7 +351,7 @@ class SQLAlchemyBillingRepository(BillingRepository):
                 {
                     "billing_id": billing.id,
                     "uuid": item.uuid,
-                    "description": self.encryption.encrypt(item.description),
+                    "description": item_description,
                     "amount": item.amount,
                     "item_type": item.item_type.value,
                     "sort_order": index,
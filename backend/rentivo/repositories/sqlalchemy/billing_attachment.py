@@ -44,6 +44,7 @@ class SQLAlchemyBillingAttachmentRepository(BillingAttachmentRepository):
     @traced("billing_attachment_repo.create")
     def create(self, attachment: BillingAttachment) -> BillingAttachment:
         attachment_uuid = str(ULID())
+        name, filename = self.encryption.encrypt_many([attachment.name, attachment.filename])
         self.conn.execute(
             text(
                 "INSERT INTO billing_attachments (uuid, billing_id, name, filename, "
@@ -54,8 +55,8 @@ class SQLAlchemyBillingAttachmentRepository(BillingAttachmentRepository):
             {
                 "uuid": attachment_uuid,
                 "billing_id": attachment.billing_id,
-                "name": self.encryption.encrypt(attachment.name),
-                "filename": self.encryption.encrypt(attachment.filename),
+                "name": name,
+                "filename": filename,
                 "storage_key": attachment.storage_key,
                 "content_type": attachment.content_type,
                 "file_size": attachment.file_size,
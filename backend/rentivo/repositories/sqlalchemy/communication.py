@@ -53,10 +53,8 @@ class SQLAlchemyCommunicationTemplateRepository(CommunicationTemplateRepository)
     def upsert(self, template: CommunicationTemplate) -> CommunicationTemplate:
         now = _now()
         existing = self.get(template.owner_type, template.owner_id, template.comm_type)
-        cipher = {
-            "subject": self.encryption.encrypt(template.subject),
-            "body": self.encryption.encrypt(template.body_markdown),
-        }
+        subject, body = self.encryption.encrypt_many([template.subject, template.body_markdown])
+        cipher = {"subject": subject, "body": body}
         if existing is None:
             uuid = str(ULID())
             self.conn.execute(
@@ -142,18 +140,31 @@ class SQLAlchemyCommunicationRepository(CommunicationRepository):
             "error, job_ulid, created_at) "
             "VALUES (:uuid, :bill_id, :ct, :name, :email, :subject, :body, :status, :error, :job_ulid, :created_at)"
         )
+        ciphertexts = self.encryption.encrypt_many(
+            [
+                value
+                for communication in communications
+                for value in (
+                    communication.recipient_name,
+                    communication.recipient_email,
+                    communication.subject,
+                    communication.body_markdown,
+                )
+            ]
+        )
         try:
-            for comm_uuid, communication in zip(comm_uuids, communications, strict=True):
+            for index, (comm_uuid, communication) in enumerate(zip(comm_uuids, communications, strict=True)):
+                name, email, subject, body = ciphertexts[4 * index : 4 * index + 4]
                 self.conn.execute(
                     statement,
                     {
                         "uuid": comm_uuid,
                         "bill_id": communication.bill_id,
                         "ct": communication.comm_type,
-                        "name": self.encryption.encrypt(communication.recipient_name),
-                        "email": self.encryption.encrypt(communication.recipient_email),
-                        "subject": self.encryption.encrypt(communication.subject),
-                        "body": self.encryption.encrypt(communication.body_markdown),
+                        "name": name,
+                        "email": email,
+                        "subject": subject,
+                        "body": body,
                         "status": communication.status,
                         "error": communication.error,
                         "job_ulid": communication.job_ulid,
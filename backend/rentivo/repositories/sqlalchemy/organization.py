@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from sqlalchemy import Connection, text
+from collections.abc import Collection
+
+from sqlalchemy import Connection, bindparam, text
 from sqlalchemy.engine import RowMapping
 from ulid import ULID
 
@@ -10,6 +12,8 @@ from rentivo.observability import traced
 from rentivo.repositories.base import OrganizationRepository
 from rentivo.repositories.sqlalchemy._common import _now
 
+_ENCRYPTED_FIELDS = ("pix_key", "pix_merchant_name", "pix_merchant_city")
+
 
 class SQLAlchemyOrganizationRepository(OrganizationRepository):
     def __init__(self, conn: Connection, encryption: EncryptionBackend) -> None:
@@ -17,19 +21,29 @@ class SQLAlchemyOrganizationRepository(OrganizationRepository):
         self.encryption = encryption
 
     def _row_to_org(self, row: RowMapping) -> Organization:
-        return Organization(
-            id=row["id"],
-            uuid=row["uuid"],
-            name=row["name"],
-            created_by=row["created_by"],
-            enforce_mfa=bool(row.get("enforce_mfa", False)),
-            pix_key=self.encryption.decrypt(row.get("pix_key", "") or ""),
-            pix_merchant_name=self.encryption.decrypt(row.get("pix_merchant_name", "") or ""),
-            pix_merchant_city=self.encryption.decrypt(row.get("pix_merchant_city", "") or ""),
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            deleted_at=row.get("deleted_at"),
+        return self._rows_to_orgs([row])[0]
+
+    def _rows_to_orgs(self, rows: list[RowMapping]) -> list[Organization]:
+        """Decrypt the PIX fields of every row in one batched call."""
+        plaintexts = iter(
+            self.encryption.decrypt_many([row.get(field, "") or "" for row in rows for field in _ENCRYPTED_FIELDS])
         )
+        return [
+            Organization(
+                id=row["id"],
+                uuid=row["uuid"],
+                name=row["name"],
+                created_by=row["created_by"],
+                enforce_mfa=bool(row.get("enforce_mfa", False)),
+                pix_key=next(plaintexts),
+                pix_merchant_name=next(plaintexts),
+                pix_merchant_city=next(plaintexts),
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+                deleted_at=row.get("deleted_at"),
+            )
+            for row in rows
+        ]
 
     @staticmethod
     def _row_to_member(row: RowMapping) -> OrganizationMember:
@@ -42,6 +56,9 @@ class SQLAlchemyOrganizationRepository(OrganizationRepository):
         )
 
     def _insert(self, org: Organization) -> int:
+        pix_key, pix_merchant_name, pix_merchant_city = self.encryption.encrypt_many(
+            [org.pix_key, org.pix_merchant_name, org.pix_merchant_city]
+        )
         result = self.conn.execute(
             text(
                 "INSERT INTO organizations "
@@ -53,9 +70,9 @@ class SQLAlchemyOrganizationRepository(OrganizationRepository):
                 "uuid": str(ULID()),
                 "name": org.name,
                 "created_by": org.created_by,
-                "pix_key": self.encryption.encrypt(org.pix_key),
-                "pix_merchant_name": self.encryption.encrypt(org.pix_merchant_name),
-                "pix_merchant_city": self.encryption.encrypt(org.pix_merchant_city),
+                "pix_key": pix_key,
+                "pix_merchant_name": pix_merchant_name,
+                "pix_merchant_city": pix_merchant_city,
                 "created_at": _now(),
                 "updated_at": _now(),
             },
@@ -139,10 +156,23 @@ class SQLAlchemyOrganizationRepository(OrganizationRepository):
             .mappings()
             .fetchall()
         )
-        return [self._row_to_org(row) for row in rows]
+        return self._rows_to_orgs(list(rows))
+
+    @traced("organization_repo.list_by_ids")
+    def list_by_ids(self, org_ids: Collection[int]) -> list[Organization]:
+        if not org_ids:
+            return []
+        stmt = text("SELECT * FROM organizations WHERE id IN :ids AND deleted_at IS NULL ORDER BY id").bindparams(
+            bindparam("ids", expanding=True)
+        )
+        rows = self.conn.execute(stmt, {"ids": list(org_ids)}).mappings().fetchall()
+        return self._rows_to_orgs(list(rows))
 
     @traced("organization_repo.update")
     def update(self, org: Organization) -> Organization:
+        pix_key, pix_merchant_name, pix_merchant_city = self.encryption.encrypt_many(
+            [org.pix_key, org.pix_merchant_name, org.pix_merchant_city]
+        )
         self.conn.execute(
             text(
                 "UPDATE organizations SET name = :name, enforce_mfa = :enforce_mfa, "
@@ -152,9 +182,9 @@ class SQLAlchemyOrganizationRepository(OrganizationRepository):
             {
                 "name": org.name,
                 "enforce_mfa": org.enforce_mfa,
-                "pix_key": self.encryption.encrypt(org.pix_key),
-                "pix_merchant_name": self.encryption.encrypt(org.pix_merchant_name),
-                "pix_merchant_city": self.encryption.encrypt(org.pix_merchant_city),
+                "pix_key": pix_key,
+                "pix_merchant_name": pix_merchant_name,
+                "pix_merchant_city": pix_merchant_city,
                 "updated_at": _now(),
                 "id": org.id,
             },
@@ -251,6 +281,18 @@ class SQLAlchemyOrganizationRepository(OrganizationRepository):
             for row in rows
         ]
 
+    @traced("organization_repo.list_memberships_for_user")
+    def list_memberships_for_user(self, user_id: int) -> list[OrganizationMember]:
+        rows = (
+            self.conn.execute(
+                text("SELECT * FROM organization_members WHERE user_id = :user_id ORDER BY organization_id"),
+                {"user_id": user_id},
+            )
+            .mappings()
+            .fetchall()
+        )
+        return [self._row_to_member(row) for row in rows]
+
     @traced("organization_repo.update_member_role")
     def update_member_role(self, org_id: int, user_id: int, role: str) -> None:
         self.conn.execute(
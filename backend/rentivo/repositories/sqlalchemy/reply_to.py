@@ -50,6 +50,9 @@ class SQLAlchemyReplyToRecipientRepository(RecipientRepository):
     def replace_for_billing(self, billing_id: int, recipients: list[Recipient]) -> None:
         self.conn.execute(text("DELETE FROM billing_reply_to WHERE billing_id = :bid"), {"bid": billing_id})
         now = _now()
+        ciphertexts = self.encryption.encrypt_many(
+            [value for recipient in recipients for value in (recipient.name, recipient.email)]
+        )
         for i, recipient in enumerate(recipients):
             self.conn.execute(
                 text(
@@ -59,8 +62,8 @@ class SQLAlchemyReplyToRecipientRepository(RecipientRepository):
                 {
                     "uuid": str(ULID()),
                     "billing_id": billing_id,
-                    "name": self.encryption.encrypt(recipient.name),
-                    "email": self.encryption.encrypt(recipient.email),
+                    "name": ciphertexts[2 * i],
+                    "email": ciphertexts[2 * i + 1],
                     "sort_order": i,
                     "created_at": now,
                 },
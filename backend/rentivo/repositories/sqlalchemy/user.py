@@ -189,15 +189,18 @@ class SQLAlchemyUserRepository(UserRepository):
 
     @traced("user_repo.update_pix")
     def update_pix(self, user_id: int, pix_key: str, pix_merchant_name: str, pix_merchant_city: str) -> None:
+        pix_key, pix_merchant_name, pix_merchant_city = self.encryption.encrypt_many(
+            [pix_key, pix_merchant_name, pix_merchant_city]
+        )
         self.conn.execute(
             text(
                 "UPDATE users SET pix_key = :pix_key, pix_merchant_name = :pix_merchant_name, "
                 "pix_merchant_city = :pix_merchant_city WHERE id = :id"
             ),
             {
-                "pix_key": self.encryption.encrypt(pix_key),
-                "pix_merchant_name": self.encryption.encrypt(pix_merchant_name),
-                "pix_merchant_city": self.encryption.encrypt(pix_merchant_city),
+                "pix_key": pix_key,
+                "pix_merchant_name": pix_merchant_name,
+                "pix_merchant_city": pix_merchant_city,
                 "id": user_id,
             },
         )
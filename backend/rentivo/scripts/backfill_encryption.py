@@ -13,17 +13,20 @@ user would be locked out.
 Behavior:
 - Walks every PII-bearing row across users, organizations, billings,
   billing_items, bills, bill_line_items, receipts, and user_totp.
-- For each PII column: if the value is non-empty AND not already encrypted by
-  the active backend, re-writes it as ciphertext.
+- For each PII column: if the value is non-empty AND not already in the
+  active backend's write format (``is_current``), re-writes it as ciphertext.
+  Under ``RENTIVO_KMS_ENVELOPE_ENABLED=true`` that migrates ``enc:v1`` rows
+  (and any remaining ``b64:v1`` or plaintext rows) to ``enc:v2``.
 - ``users.email`` is handled specially: alongside re-encryption, the
   normalized HMAC-SHA256 blind index is written to ``users.email_hash``.
 - Idempotent. Re-running is safe.
 - ``--dry-run`` prints a count per (table, column) without writing.
 
 Operator note: run this immediately after switching
-``RENTIVO_ENCRYPTION_BACKEND`` from ``base64`` to ``kms``. New rows written
-between the cutover and the backfill are already encrypted; the backfill
-picks up the legacy plaintext rows.
+``RENTIVO_ENCRYPTION_BACKEND`` from ``base64`` to ``kms``, and again after
+turning on ``RENTIVO_KMS_ENVELOPE_ENABLED``. New rows written between the
+cutover and the backfill are already in the new format; the backfill picks up
+the legacy rows.
 """
 
 from __future__ import annotations
@@ -65,15 +68,17 @@ def _encrypt_column(
 ) -> tuple[int, int]:
     """Encrypt ``column`` in ``table``. Returns (rewritten_count, skipped_count).
 
-    Skip path: ``is_encrypted(value)`` matches **only** the active backend's
-    format. We can't compare ``encrypt(decrypt(value)) == value`` for skipping
+    Skip path: ``is_current(value)`` matches **only** the active backend's
+    write format. We can't compare ``encrypt(decrypt(value)) == value`` for skipping
     because KMS encryption is non-deterministic (re-encrypting plaintext yields
     a different blob each time).
 
     Rewrite path: ``encrypt(decrypt(value))`` round-trips through plaintext.
     This is what makes a base64->kms backfill safe: KMSBackend.decrypt knows how
     to unwrap a ``b64:v1:`` row, so we re-encrypt the original plaintext under
-    KMS rather than wrapping the literal ``b64:v1:...`` string.
+    KMS rather than wrapping the literal ``b64:v1:...`` string. The same holds
+    for a v1->v2 migration: ``decrypt`` opens the ``enc:v1`` blob, and
+    ``encrypt`` seals the plaintext as ``enc:v2``.
     """
     rows = (
         conn.execute(text(f"SELECT {pk_column} AS pk, {column} AS val FROM {table}"))  # noqa: S608
@@ -84,7 +89,7 @@ def _encrypt_column(
     skipped = 0
     for row in rows:
         value = row["val"] or ""
-        if value == "" or encryption.is_encrypted(value):
+        if value == "" or encryption.is_current(value):
             skipped += 1
             continue
         ciphertext = encryption.encrypt(encryption.decrypt(value))
@@ -112,8 +117,8 @@ def _backfill_users_email(
     decrypted (or already-plaintext) email value, normalised via
     :func:`rentivo.blind_index.compute_email_hash`.
 
-    Skip path: a row is fully migrated when its email column is encrypted by
-    the active backend AND its email_hash is non-NULL. Anything short of that
+    Skip path: a row is fully migrated when its email column is in the active
+    backend's write format AND its email_hash is non-NULL. Anything short of that
     gets rewritten.
     """
     from rentivo.blind_index import compute_email_hash
@@ -127,7 +132,7 @@ def _backfill_users_email(
             skipped += 1
             continue
 
-        already_encrypted = encryption.is_encrypted(value)
+        already_encrypted = encryption.is_current(value)
         hash_populated = bool(row["email_hash"])
 
         if already_encrypted and hash_populated:
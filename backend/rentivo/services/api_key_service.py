@@ -232,23 +232,35 @@ class APIKeyService:
                 key = key.model_copy(update={"last_used_at": now})
         return key
 
-    def can_access_resource(
+    def grants_resource(
         self,
         key: APIKey,
         resource_type: Literal["user", "organization"],
         resource_id: int,
     ) -> bool:
+        """Whether ``key`` is scoped to the resource, before any live-membership check.
+
+        Pure and query-free, so list endpoints can filter many resources and then
+        confirm organization membership in bulk.
+        """
         if resource_type == "user":
             if resource_id != key.user_id:
                 return False
             return key.is_login_token or APIKeyGrant(resource_type="user", resource_id=resource_id) in key.grants
         if resource_type != "organization":
             return False
-        if (
-            not key.is_login_token
-            and APIKeyGrant(resource_type="organization", resource_id=resource_id) not in key.grants
-        ):
+        return key.is_login_token or APIKeyGrant(resource_type="organization", resource_id=resource_id) in key.grants
+
+    def can_access_resource(
+        self,
+        key: APIKey,
+        resource_type: Literal["user", "organization"],
+        resource_id: int,
+    ) -> bool:
+        if not self.grants_resource(key, resource_type, resource_id):
             return False
+        if resource_type == "user":
+            return True
         return self._has_live_organization_membership(resource_id, key.user_id)
 
     def update_integration(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+
 import structlog
 
 from rentivo.models.billing import Billing
@@ -27,6 +29,29 @@ class AuthorizationService:
         logger.debug("authz_role", user_id=user_id, billing_id=billing.id, role=None)
         return None
 
+    @traced("authorization.get_roles_for_billings")
+    def get_roles_for_billings(self, user_id: int, billings: Collection[Billing]) -> dict[int, str]:
+        """Bulk :meth:`get_role_for_billing`: the user's role per saved billing id.
+
+        Billings the user has no role on are left out. Organization roles come
+        from one membership query for the user, however many billings share them.
+        """
+        org_roles: dict[int, str] = {}
+        if self.org_repo is not None and any(billing.owner_type == "organization" for billing in billings):
+            org_roles = {
+                member.organization_id: member.role for member in self.org_repo.list_memberships_for_user(user_id)
+            }
+        roles: dict[int, str] = {}
+        for billing in billings:
+            if billing.id is None:
+                continue
+            if billing.owner_type == "user" and billing.owner_id == user_id:
+                roles[billing.id] = "owner"
+            elif billing.owner_type == "organization" and billing.owner_id in org_roles:
+                roles[billing.id] = org_roles[billing.owner_id]
+        logger.debug("authz_roles", user_id=user_id, requested=len(billings), granted=len(roles))
+        return roles
+
     @traced("authorization.can_view_billing")
     def can_view_billing(self, user_id: int, billing: Billing) -> bool:
         result = self.get_role_for_billing(user_id, billing) is not None
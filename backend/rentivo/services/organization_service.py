@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+
 import structlog
 
 from rentivo.models.organization import Organization, OrganizationMember
@@ -51,6 +53,13 @@ class OrganizationService:
         logger.debug("organization_get_by_id", org_id=org_id, found=result is not None)
         return result
 
+    @traced("organization.get_many")
+    def get_many(self, org_ids: Collection[int]) -> dict[int, Organization]:
+        """Live organizations among ``org_ids``, keyed by id, from one query."""
+        result = {org.id: org for org in self.repo.list_by_ids(org_ids) if org.id is not None}
+        logger.debug("organization_get_many", requested=len(org_ids), found=len(result))
+        return result
+
     @traced("organization.get_by_uuid")
     def get_by_uuid(self, uuid: str) -> Organization | None:
         result = self.repo.get_by_uuid(uuid)
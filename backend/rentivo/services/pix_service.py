@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 import structlog
@@ -72,6 +73,13 @@ class PixService:
         display = owner.name if billing.owner_type == "organization" else owner.email
         return display or None
 
+    def prime_organizations(self, organizations: Iterable[Organization]) -> None:
+        """Seed the owner memo with organizations the caller already loaded, so
+        resolving PIX for their billings costs no further queries."""
+        for organization in organizations:
+            if organization.id is not None:
+                self._owner_cache[("organization", organization.id)] = organization
+
     def _get_owner(self, owner_type: str, owner_id: int) -> Organization | User | None:
         key = (owner_type, owner_id)
         if key not in self._owner_cache:
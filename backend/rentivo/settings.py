@@ -18,6 +18,20 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_prefix="RENTIVO_", extra="ignore")
 
     db_url: str = "mysql+pymysql://rentivo:rentivo@db:3306/rentivo"
+    # One connection pool per process, shared by every thread that touches the
+    # database (API offload pools, worker threads); size it for them. Checkouts
+    # past `db_pool_size + db_pool_max_overflow` wait up to the timeout, then fail.
+    db_pool_size: int = 5
+    db_pool_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    # Connections older than this are replaced at checkout; `0` keeps them forever.
+    db_pool_recycle_seconds: int = 1800
+    # Ping each connection on checkout (one round-trip) instead of finding a dead
+    # one on the first real query.
+    db_pool_pre_ping: bool = True
+    # Reuse the most recently returned connection first, letting idle ones age
+    # out under `db_pool_recycle_seconds` after a burst.
+    db_pool_lifo: bool = False
 
     storage_backend: str = "local"
     storage_local_path: str = "./invoices"
@@ -70,6 +84,19 @@ class Settings(BaseSettings):
     gtm_container_id: str = ""
     environment: str = "production"
 
+    # Run the blocking service/repository half of API handlers on bounded
+    # per-route-class thread pools instead of the event loop (see
+    # rentivo/api/offload.py). Off by default: handlers run inline.
+    api_offload_enabled: bool = False
+    api_offload_read_workers: int = 32
+    api_offload_write_workers: int = 16
+    api_offload_auth_workers: int = 8
+    api_offload_render_workers: int = 4
+    # Event-loop lag sampling in the API process; `0` disables the monitor.
+    # Samples at or above the warn threshold are logged as `event_loop_lag`.
+    api_loop_lag_interval_seconds: float = 1.0
+    api_loop_lag_warn_seconds: float = 0.25
+
     @field_validator("gtm_container_id")
     @classmethod
     def _validate_gtm_id(cls, v: str) -> str:
@@ -110,6 +137,21 @@ class Settings(BaseSettings):
     kms_access_key_id: str = ""
     kms_secret_access_key: str = ""
     kms_endpoint_url: str = ""
+    # Process-wide ceiling on concurrent KMS calls (and the size of the shared
+    # decrypt pool). Throttling halves the live limit; clean calls grow it back.
+    kms_max_in_flight: int = 32
+    # Write new ciphertext as enc:v2 envelope encryption (AES-GCM under a
+    # KMS-wrapped data key cached in process) instead of enc:v1 direct KMS.
+    # Both formats are always readable. Bounds below cap how long, and for how
+    # many values, one plaintext data key lives in memory.
+    kms_envelope_enabled: bool = False
+    kms_data_key_max_age_seconds: int = 300
+    kms_data_key_max_uses: int = 10_000
+    kms_data_key_cache_entries: int = 1024
+    # HTTP connection-pool size of each shared boto3 client (S3, SES, KMS).
+    # One client per service/region/endpoint/credentials serves the whole
+    # process, so size this for the concurrent callers, not per request.
+    aws_max_pool_connections: int = 32
 
     encryption_cache_backend: str = "none"
     encryption_cache_ttl_seconds: int = 60
@@ -298,6 +340,74 @@ class Settings(BaseSettings):
             raise ValueError("Authentication durations must be positive")
         return v
 
+    @field_validator("db_pool_size")
+    @classmethod
+    def _validate_db_pool_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("RENTIVO_DB_POOL_SIZE must be >= 1")
+        return v
+
+    @field_validator("db_pool_max_overflow", "db_pool_recycle_seconds")
+    @classmethod
+    def _validate_db_pool_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("RENTIVO_DB_POOL_MAX_OVERFLOW and RENTIVO_DB_POOL_RECYCLE_SECONDS must be >= 0")
+        return v
+
+    @field_validator("db_pool_timeout_seconds")
+    @classmethod
+    def _validate_db_pool_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("RENTIVO_DB_POOL_TIMEOUT_SECONDS must be > 0")
+        return v
+
+    @field_validator(
+        "api_offload_read_workers",
+        "api_offload_write_workers",
+        "api_offload_auth_workers",
+        "api_offload_render_workers",
+    )
+    @classmethod
+    def _validate_api_offload_workers(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("API offload pool sizes must be >= 1")
+        return v
+
+    @field_validator("api_loop_lag_interval_seconds")
+    @classmethod
+    def _validate_api_loop_lag_interval(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("RENTIVO_API_LOOP_LAG_INTERVAL_SECONDS must be >= 0")
+        return v
+
+    @field_validator("api_loop_lag_warn_seconds")
+    @classmethod
+    def _validate_api_loop_lag_warn(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("RENTIVO_API_LOOP_LAG_WARN_SECONDS must be > 0")
+        return v
+
+    @field_validator("kms_max_in_flight")
+    @classmethod
+    def _validate_kms_max_in_flight(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("RENTIVO_KMS_MAX_IN_FLIGHT must be >= 1")
+        return v
+
+    @field_validator("kms_data_key_max_age_seconds", "kms_data_key_max_uses", "kms_data_key_cache_entries")
+    @classmethod
+    def _validate_kms_data_key_bounds(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("KMS data-key cache bounds must be >= 1")
+        return v
+
+    @field_validator("aws_max_pool_connections")
+    @classmethod
+    def _validate_aws_max_pool_connections(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("RENTIVO_AWS_MAX_POOL_CONNECTIONS must be >= 1")
+        return v
+
     @field_validator("otel_sample_ratio")
     @classmethod
     def _validate_otel_sample_ratio(cls, v: float) -> float:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import structlog
 
-from rentivo.aws import build_client
+from rentivo.aws import shared_client
 from rentivo.observability import traced
 from rentivo.storage.base import FileRef, StorageBackend
 
@@ -21,7 +21,7 @@ class S3Storage(StorageBackend):
     ) -> None:
         self.bucket = bucket
         self.presigned_expiry = presigned_expiry
-        self.client = build_client(
+        self.client = shared_client(
             "s3",
             region=region,
             access_key_id=access_key_id,
@@ -8,6 +8,7 @@ from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from starlette.responses import Response
 
 from rentivo.analytics import analytics_hash
@@ -15,6 +16,7 @@ from rentivo.api.app import create_app
 from rentivo.api.csrf import CSRF_HEADER_NAME, issue_csrf_token
 from rentivo.api.dependencies import get_services
 from rentivo.api.principal import Principal
+from rentivo.api.routes.billings import _billing_list
 from rentivo.api.routes.billings import router as billings_router
 from rentivo.api.schemas.billings import MAX_COMMUNICATION_BODY_LENGTH
 from rentivo.communications.moderation import ModerationResult
@@ -31,7 +33,13 @@ from rentivo.models.expense import Expense
 from rentivo.models.organization import Organization, OrganizationMember
 from rentivo.models.recipient import Recipient
 from rentivo.models.user import User
+from rentivo.repositories.sqlalchemy import (
+    SQLAlchemyBillingRepository,
+    SQLAlchemyOrganizationRepository,
+    SQLAlchemyUserRepository,
+)
 from rentivo.services.billing_stats import BillingStats
+from rentivo.services.container import RequestServices
 from rentivo.settings import settings
 from rentivo.storage.base import FileRef
 
@@ -159,6 +167,9 @@ class FakeOrganizationService:
     def get_by_id(self, organization_id: int) -> Organization | None:
         return self.organizations.get(organization_id)
 
+    def get_many(self, organization_ids: set[int]) -> dict[int, Organization]:
+        return {org_id: self.organizations[org_id] for org_id in organization_ids if org_id in self.organizations}
+
     def get_by_uuid(self, organization_uuid: str) -> Organization | None:
         return next((org for org in self.organizations.values() if org.uuid == organization_uuid), None)
 
@@ -182,17 +193,20 @@ class FakeAPIKeyService:
     def authenticate(self, secret: str) -> APIKey | None:
         return self.credentials.get(secret)
 
-    def can_access_resource(self, key: APIKey, resource_type: str, resource_id: int) -> bool:
+    @staticmethod
+    def grants_resource(key: APIKey, resource_type: str, resource_id: int) -> bool:
         if resource_type == "user":
             return resource_id == key.user_id and (
                 key.is_login_token or APIKeyGrant(resource_type="user", resource_id=resource_id) in key.grants
             )
         if resource_type != "organization":
             return False
-        has_grant = (
-            key.is_login_token or APIKeyGrant(resource_type="organization", resource_id=resource_id) in key.grants
-        )
-        return has_grant and self.organizations.get_member(resource_id, key.user_id) is not None
+        return key.is_login_token or APIKeyGrant(resource_type="organization", resource_id=resource_id) in key.grants
+
+    def can_access_resource(self, key: APIKey, resource_type: str, resource_id: int) -> bool:
+        if not self.grants_resource(key, resource_type, resource_id):
+            return False
+        return resource_type == "user" or self.organizations.get_member(resource_id, key.user_id) is not None
 
 
 class FakeAuthorizationService:
@@ -208,6 +222,10 @@ class FakeAuthorizationService:
         member = self.organizations.get_member(billing.owner_id, user_id)
         return member.role if member is not None else None
 
+    def get_roles_for_billings(self, user_id: int, billings: list[Billing]) -> dict[int, str]:
+        roles = {billing.id: self.get_role_for_billing(user_id, billing) for billing in billings}
+        return {billing_id: role for billing_id, role in roles.items() if role is not None}
+
 
 class FakeBillingService:
     def __init__(self, recipient: Any, reply_to: Any) -> None:
@@ -399,6 +417,10 @@ class FakePixService:
     def billing_needs_setup(self, billing: Billing) -> bool:
         return billing.id not in self.ready_billing_ids
 
+    @staticmethod
+    def prime_organizations(organizations: Any) -> None:
+        list(organizations)
+
 
 class FakeRecipientService:
     def __init__(self, prefix: str) -> None:
@@ -830,6 +852,18 @@ def test_list_intersects_personal_and_organization_billings_with_grants_and_live
     assert billing_harness.services.billing_stats.calls == [[PERSONAL_BILLING.id]]
 
 
+def test_list_serves_the_same_response_with_offload_enabled(
+    billing_harness: BillingHarness, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inline = billing_harness.request("GET", "/api/v1/billings", credential=INTEGRATION_SECRET)
+    monkeypatch.setattr(settings, "api_offload_enabled", True)
+
+    offloaded = billing_harness.request("GET", "/api/v1/billings", credential=INTEGRATION_SECRET)
+
+    assert offloaded.status_code == 200
+    assert offloaded.json() == inline.json()
+
+
 def test_login_list_filters_stale_organization_membership(billing_harness: BillingHarness) -> None:
     billing_harness.services.organization.members.pop((ORGANIZATION.id, USER.id))
 
@@ -2456,3 +2490,59 @@ def test_billings_openapi_contract_is_complete_typed_and_strict(billing_harness:
             }
         },
     }
+
+
+def test_list_drops_billings_of_deleted_organizations(billing_harness: BillingHarness) -> None:
+    billing_harness.services.organization.organizations.pop(ORGANIZATION.id)
+
+    response = billing_harness.request("GET", "/api/v1/billings")
+
+    assert response.status_code == 200
+    assert [item["uuid"] for item in response.json()["items"]] == [PERSONAL_BILLING.uuid]
+
+
+def _seed_billing_list(db_connection, fake_encryption, *, organizations: int, billings_per_owner: int) -> User:
+    user = SQLAlchemyUserRepository(db_connection, fake_encryption).create(
+        User(email=f"manager-{organizations}@example.com", password_hash="hash")
+    )
+    org_repo = SQLAlchemyOrganizationRepository(db_connection, fake_encryption)
+    billing_repo = SQLAlchemyBillingRepository(db_connection, fake_encryption)
+    owners = [("user", user.id)]
+    for index in range(organizations):
+        org = org_repo.create_with_admin(Organization(name=f"Org {index}", created_by=user.id))
+        owners.append(("organization", org.id))
+    for owner_type, owner_id in owners:
+        for index in range(billings_per_owner):
+            billing_repo.create(
+                Billing(
+                    name=f"{owner_type}-{owner_id}-{index}",
+                    owner_type=owner_type,
+                    owner_id=owner_id,
+                    items=[BillingItem(description="Aluguel", amount=100_000, item_type=ItemType.FIXED)],
+                )
+            )
+    return user
+
+
+def test_billing_list_runs_a_constant_number_of_queries(db_connection, fake_encryption) -> None:
+    def count_queries(user: User) -> tuple[int, int]:
+        services = RequestServices(conn=db_connection, encryption=fake_encryption)
+        principal = Principal(user=user, api_key=LOGIN_KEY.model_copy(update={"user_id": user.id}), source="web")
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+
+        event.listen(db_connection, "before_cursor_execute", record)
+        try:
+            response = _billing_list(principal, services)
+        finally:
+            event.remove(db_connection, "before_cursor_execute", record)
+        return len(statements), len(response.items)
+
+    small = count_queries(_seed_billing_list(db_connection, fake_encryption, organizations=1, billings_per_owner=1))
+    large = count_queries(_seed_billing_list(db_connection, fake_encryption, organizations=6, billings_per_owner=5))
+
+    assert small[1] == 2
+    assert large[1] == 35
+    assert large[0] == small[0]
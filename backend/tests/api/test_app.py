@@ -6,12 +6,14 @@ from fastapi import Depends
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event, text
 from starlette.background import BackgroundTask
-from starlette.responses import JSONResponse, StreamingResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 from rentivo.api.app import create_app
 from rentivo.api.dependencies import get_services
 from rentivo.api.errors import ProblemException, get_request_id
+from rentivo.api.routes._pdf_streaming import stored_file_response
 from rentivo.services.container import RequestServices
+from rentivo.storage.base import FileRef
 
 
 def test_tarpit_sleep_clamps_an_elapsed_deadline_without_patching_asyncio() -> None:
@@ -229,6 +231,45 @@ def test_background_task_keeps_request_resources_until_it_finishes(monkeypatch):
     connection.close.assert_called_once_with()
 
 
+def test_stored_file_download_releases_the_request_connection_before_sending(monkeypatch, tmp_path):
+    import rentivo.api.app as api_app
+
+    stored = tmp_path / "fatura.pdf"
+    stored.write_bytes(b"%PDF-1.4")
+    connection = MagicMock()
+    engine = MagicMock()
+    engine.connect.return_value = connection
+    monkeypatch.setattr(api_app, "get_engine", lambda: engine)
+    monkeypatch.setattr(api_app, "get_encryption", MagicMock())
+    observed: list[bool] = []
+    app = create_app()
+
+    @app.get("/api/v1/download")
+    async def download(_services: RequestServices = Depends(get_services)) -> Response:
+        return stored_file_response(
+            FileRef(kind="local", location=str(stored)), content_type="application/pdf", filename="fatura.pdf"
+        )
+
+    def watch_body(inner):
+        async def middleware(scope, receive, send):
+            async def watching_send(message):
+                if message["type"] == "http.response.body":
+                    observed.append(connection.close.called)
+                await send(message)
+
+            await inner(scope, receive, watching_send)
+
+        return middleware
+
+    app.add_middleware(watch_body)
+    with TestClient(app) as client:
+        response = client.get("/api/v1/download")
+
+    assert response.content == b"%PDF-1.4"
+    assert observed and all(observed)
+    connection.close.assert_called_once_with()
+
+
 def test_request_id_is_validated_and_propagated_to_problem_responses():
     with TestClient(create_app()) as client:
         accepted = client.get("/api/v1/missing", headers={"X-Request-ID": "accepted-123"})
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -131,6 +132,27 @@ def test_local_refs_stream_the_file_and_remote_refs_redirect_without_caching(tmp
     assert local.headers["Cache-Control"] == remote.headers["Cache-Control"] == "no-store"
 
 
+def test_detached_file_response_serves_without_a_request_connection(tmp_path) -> None:
+    stored = tmp_path / "recibo.pdf"
+    stored.write_bytes(b"%PDF-1.4")
+    response = stored_file_response(
+        FileRef(kind="local", location=str(stored)),
+        content_type="application/pdf",
+        filename="recibo.pdf",
+    )
+    messages: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request"}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    asyncio.run(response({"type": "http", "method": "GET", "headers": []}, receive, send))
+
+    assert messages[-1]["body"] == b"%PDF-1.4"
+
+
 def test_bill_pdf_helpers_dispatch_on_the_document_kind() -> None:
     bill = _bill()
     services = SimpleNamespace(bill=MagicMock())
@@ -0,0 +1,168 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rentivo.api import offload
+from rentivo.api.app import create_app
+from rentivo.api.errors import ProblemException
+from rentivo.api.offload import RouteClass, monitor_event_loop_lag, run_blocking, shutdown_pools
+from rentivo.observability import metrics
+from rentivo.settings import settings
+
+_marker: contextvars.ContextVar[str] = contextvars.ContextVar("offload_marker", default="unset")
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    metrics._reset_for_tests()
+    yield
+    shutdown_pools()
+    metrics._reset_for_tests()
+
+
+def _summary(name: str) -> dict:
+    (row,) = [row for row in metrics.snapshot()["summaries"] if row["name"] == name]
+    return row
+
+
+def test_disabled_offload_runs_inline_on_the_event_loop_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "api_offload_enabled", False)
+
+    async def main() -> tuple[int, int]:
+        return threading.get_ident(), await run_blocking(RouteClass.READ, threading.get_ident)
+
+    loop_thread, call_thread = asyncio.run(main())
+
+    assert call_thread == loop_thread
+    assert offload._pools == {}
+    assert metrics.snapshot()["summaries"] == []
+
+
+def test_enabled_offload_runs_on_the_route_class_pool_with_caller_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "api_offload_enabled", True)
+    monkeypatch.setattr(settings, "api_offload_render_workers", 2)
+
+    def work(prefix: str, *, suffix: str) -> tuple[str, str]:
+        return threading.current_thread().name, f"{prefix}{_marker.get()}{suffix}"
+
+    async def main() -> tuple[str, str]:
+        _marker.set("ctx")
+        return await run_blocking(RouteClass.RENDER, work, "<", suffix=">")
+
+    thread_name, value = asyncio.run(main())
+
+    assert thread_name.startswith("rentivo-api-render")
+    assert value == "<ctx>"
+    assert offload._pools[RouteClass.RENDER]._max_workers == 2
+    summary = _summary("api.offload.queue_wait_seconds")
+    assert summary["labels"] == {"route_class": "render"}
+    assert summary["count"] == 1
+
+
+def test_enabled_offload_reuses_one_pool_per_route_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "api_offload_enabled", True)
+
+    async def main() -> None:
+        await run_blocking(RouteClass.READ, int)
+        await run_blocking(RouteClass.READ, int)
+        await run_blocking(RouteClass.AUTH, int)
+
+    asyncio.run(main())
+
+    assert set(offload._pools) == {RouteClass.READ, RouteClass.AUTH}
+    reads = [row for row in metrics.snapshot()["summaries"] if row["labels"] == {"route_class": "read"}]
+    assert reads[0]["count"] == 2
+
+
+def test_enabled_offload_propagates_handler_exceptions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "api_offload_enabled", True)
+
+    def deny() -> None:
+        raise ProblemException.forbidden("billing_forbidden", "Sem acesso.")
+
+    with pytest.raises(ProblemException) as raised:
+        asyncio.run(run_blocking(RouteClass.WRITE, deny))
+
+    assert raised.value.problem.code == "billing_forbidden"
+
+
+def test_shutdown_pools_drops_every_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "api_offload_enabled", True)
+    asyncio.run(run_blocking(RouteClass.WRITE, int))
+    pool = offload._pools[RouteClass.WRITE]
+
+    shutdown_pools()
+
+    assert offload._pools == {}
+    with pytest.raises(RuntimeError):
+        pool.submit(int)
+
+
+def test_pool_creation_is_double_checked_under_the_lock(monkeypatch: pytest.MonkeyPatch) -> None:
+    existing = ThreadPoolExecutor(max_workers=1)
+
+    class RacingLock:
+        def __enter__(self):
+            offload._pools[RouteClass.READ] = existing
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(offload, "_pools_lock", RacingLock())
+
+    assert offload._pool(RouteClass.READ) is existing
+
+
+def test_lag_monitor_records_samples_and_warns_past_the_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    logger = MagicMock()
+    monkeypatch.setattr(offload, "logger", logger)
+
+    async def main() -> None:
+        task = asyncio.create_task(monitor_event_loop_lag(0.001, 0.02))
+        await asyncio.sleep(0.01)
+        threading.Event().wait(0.05)  # block the loop so the next sample is late
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    summary = _summary("api.event_loop.lag_seconds")
+    assert summary["count"] >= 2
+    assert summary["max"] >= 0.02
+    (event,), fields = logger.warning.call_args
+    assert event == "event_loop_lag"
+    assert fields["lag_ms"] >= 20
+
+
+def test_lifespan_starts_and_cancels_the_lag_monitor(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "api_loop_lag_interval_seconds", 0.001)
+    monkeypatch.setattr(settings, "api_offload_enabled", True)
+    app = create_app()
+
+    @app.get("/api/v1/offload-probe")
+    async def probe() -> dict[str, str]:
+        return {"thread": await run_blocking(RouteClass.READ, lambda: threading.current_thread().name)}
+
+    with TestClient(app) as client:
+        response = client.get("/api/v1/offload-probe")
+        client.get("/api/v1/health")
+
+    assert response.json()["thread"].startswith("rentivo-api-read")
+    assert offload._pools == {}
+    assert _summary("api.event_loop.lag_seconds")["count"] >= 1
+
+
+def test_lifespan_skips_the_lag_monitor_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "api_loop_lag_interval_seconds", 0)
+
+    with TestClient(create_app()) as client:
+        client.get("/api/v1/health")
+
+    assert metrics.snapshot()["summaries"] == []
@@ -9,6 +9,7 @@ import pytest
 from sqlalchemy import Connection, create_engine, event, text
 from sqlalchemy.engine import Engine
 
+from rentivo import aws
 from rentivo.encryption.base import EncryptionBackend
 from rentivo.models.bill import Bill, BillLineItem
 from rentivo.models.billing import Billing, BillingItem, ItemType
@@ -320,6 +321,14 @@ CREATE TABLE known_devices (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_aws_clients():
+    """Tests patch ``rentivo.aws.boto3`` per test; never hand one test another's client."""
+    aws._reset_for_tests()
+    yield
+    aws._reset_for_tests()
+
+
 @pytest.fixture()
 def db_engine() -> Engine:
     engine = create_engine("sqlite:///:memory:")
@@ -1,5 +1,5 @@
 from email import message_from_bytes
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 from rentivo.email.base import EmailAttachment, EmailMessage
 from rentivo.email.ses import SESEmailBackend
@@ -34,6 +34,7 @@ def test_send_calls_ses_with_expected_payload(boto3_mock):
         region_name="us-east-1",
         aws_access_key_id="AKIA",
         aws_secret_access_key="secret",
+        config=ANY,
     )
     sent_kwargs = client.send_email.call_args.kwargs
     assert sent_kwargs["Source"] == "noreply@rentivo.com.br"
@@ -10,12 +10,14 @@ from tests.observability.conftest import reset_tracing, span_exporter  # noqa: F
 def _reset_and_close() -> None:
     """Close any cache resources held by the cached backend, then drop it."""
     from rentivo.encryption import factory as factory_module
+    from rentivo.encryption import kms as kms_module
     from rentivo.encryption.caching import CachingEncryptionBackend
 
     backend = factory_module._backend
     if isinstance(backend, CachingEncryptionBackend):
         backend.cache.close()
     factory_module._reset_for_tests()
+    kms_module._reset_for_tests()
 
 
 @pytest.fixture(autouse=True)
@@ -36,3 +36,22 @@ def test_decrypt_many_default_falls_back_to_sequential_decrypt():
     backend = Echo()
     assert backend.decrypt_many(["a", "b", "c"]) == ["A", "B", "C"]
     assert backend.decrypt_many([]) == []
+
+
+def test_encrypt_many_default_falls_back_to_sequential_encrypt():
+    class Echo(EncryptionBackend):
+        def encrypt(self, plaintext: str) -> str:
+            return plaintext.upper()
+
+        def decrypt(self, value: str) -> str:
+            return value
+
+        def is_encrypted(self, value: str) -> bool:
+            return value.startswith("X")
+
+    backend = Echo()
+    assert backend.encrypt_many(["a", "b", "c"]) == ["A", "B", "C"]
+    assert backend.encrypt_many([]) == []
+    # With a single write format, "current" is the same as "encrypted".
+    assert backend.is_current("Xyz") is True
+    assert backend.is_current("abc") is False
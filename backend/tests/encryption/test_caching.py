@@ -51,6 +51,19 @@ def test_is_encrypted_bypasses_cache():
     cache.get_many.assert_not_called()
 
 
+def test_encrypt_many_and_is_current_delegate_to_inner():
+    inner = _StubBackend()
+    cache = MagicMock(spec=NullDecryptCache)
+    wrapper = CachingEncryptionBackend(inner=inner, cache=cache)
+
+    assert wrapper.encrypt_many(["a", "b"]) == ["enc:a", "enc:b"]
+    assert inner.encrypt_calls == 2
+    assert wrapper.is_current("enc:x") is True
+    assert wrapper.is_current("x") is False
+    cache.get_many.assert_not_called()
+    cache.set_many.assert_not_called()
+
+
 def test_decrypt_hit_skips_inner():
     inner = _StubBackend()
     cache = MagicMock()
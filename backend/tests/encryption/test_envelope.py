@@ -0,0 +1,128 @@
+import base64
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from rentivo.encryption.envelope import V2_PREFIX, DataKeyCache, open_sealed, seal, wrapped_key
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeKMS:
+    def __init__(self) -> None:
+        self.keys: dict[bytes, bytes] = {}
+        self.generated = 0
+        self.unwrapped = 0
+
+    def generate(self) -> tuple[bytes, bytes]:
+        self.generated += 1
+        plaintext = os.urandom(32)
+        wrapped = b"wrapped-%d" % self.generated
+        self.keys[wrapped] = plaintext
+        return plaintext, wrapped
+
+    def unwrap(self, wrapped: bytes) -> bytes:
+        self.unwrapped += 1
+        return self.keys[wrapped]
+
+
+def _cache(kms: FakeKMS, clock: FakeClock, **overrides) -> DataKeyCache:
+    bounds = {"max_age_seconds": 300, "max_uses": 3, "max_entries": 2}
+    bounds.update(overrides)
+    return DataKeyCache(generate=kms.generate, unwrap=kms.unwrap, clock=clock, **bounds)
+
+
+def test_seal_round_trips_and_embeds_the_wrapped_key() -> None:
+    key = os.urandom(32)
+
+    token = seal("Aluguel — março", key, b"wrapped")
+
+    assert token.startswith(V2_PREFIX)
+    assert wrapped_key(token) == b"wrapped"
+    assert open_sealed(token, key) == "Aluguel — março"
+
+
+def test_seal_uses_a_fresh_nonce_per_value() -> None:
+    key = os.urandom(32)
+
+    assert seal("same", key, b"w") != seal("same", key, b"w")
+
+
+def test_tampered_payload_fails_authentication() -> None:
+    key = os.urandom(32)
+    prefix, _, payload = seal("secret", key, b"w").rpartition(":")
+    raw = bytearray(base64.b64decode(payload))
+    raw[-1] ^= 1
+    tampered = f"{prefix}:{base64.b64encode(bytes(raw)).decode('ascii')}"
+
+    with pytest.raises(InvalidTag):
+        open_sealed(tampered, key)
+
+
+def test_encrypt_key_is_reused_until_its_use_budget_runs_out() -> None:
+    kms = FakeKMS()
+    cache = _cache(kms, FakeClock(), max_uses=3)
+
+    wrapped = [cache.for_encrypt()[1] for _ in range(4)]
+
+    assert wrapped == [b"wrapped-1"] * 3 + [b"wrapped-2"]
+    assert kms.generated == 2
+
+
+def test_encrypt_key_is_rotated_once_it_is_too_old() -> None:
+    kms = FakeKMS()
+    clock = FakeClock()
+    cache = _cache(kms, clock, max_uses=100)
+    cache.for_encrypt()
+
+    clock.now = 300
+
+    assert cache.for_encrypt()[1] == b"wrapped-2"
+
+
+def test_generated_keys_decrypt_without_unwrapping() -> None:
+    kms = FakeKMS()
+    cache = _cache(kms, FakeClock())
+    key, wrapped = cache.for_encrypt()
+
+    assert cache.for_decrypt(wrapped) == key
+    assert kms.unwrapped == 0
+
+
+def test_unwrapped_keys_are_cached_until_they_expire() -> None:
+    kms = FakeKMS()
+    clock = FakeClock()
+    key, wrapped = kms.generate()
+    cache = _cache(kms, clock)
+
+    assert cache.cached(wrapped) is None
+    assert cache.for_decrypt(wrapped) == key
+    assert cache.for_decrypt(wrapped) == key
+    assert kms.unwrapped == 1
+
+    clock.now = 300
+    assert cache.cached(wrapped) is None
+    assert cache.for_decrypt(wrapped) == key
+    assert kms.unwrapped == 2
+
+
+def test_unwrapped_keys_are_evicted_least_recently_used() -> None:
+    kms = FakeKMS()
+    cache = _cache(kms, FakeClock(), max_entries=2)
+    first, second, third = (kms.generate()[1] for _ in range(3))
+    cache.for_decrypt(first)
+    cache.for_decrypt(second)
+    cache.for_decrypt(first)  # first is now the most recently used
+
+    cache.for_decrypt(third)
+
+    assert cache.cached(first) is not None
+    assert cache.cached(second) is None
+    assert cache.cached(third) is not None
@@ -27,6 +27,10 @@ class TestEncryptionFactory:
         mock_settings.kms_access_key_id = "key"
         mock_settings.kms_secret_access_key = "secret"
         mock_settings.kms_endpoint_url = ""
+        mock_settings.kms_envelope_enabled = False
+        mock_settings.kms_data_key_max_age_seconds = 300
+        mock_settings.kms_data_key_max_uses = 10_000
+        mock_settings.kms_data_key_cache_entries = 1024
 
         with patch("rentivo.aws.boto3"):
             from rentivo.encryption.factory import get_encryption
@@ -34,6 +38,30 @@ class TestEncryptionFactory:
 
             backend = get_encryption()
             assert isinstance(backend, KMSBackend)
+            assert backend.envelope is False
+
+    @patch("rentivo.encryption.factory.settings")
+    def test_kms_envelope_settings_reach_the_backend(self, mock_settings):
+        mock_settings.encryption_backend = "kms"
+        mock_settings.encryption_cache_backend = "none"
+        mock_settings.kms_key_id = "alias/rentivo"
+        mock_settings.kms_region = "us-east-1"
+        mock_settings.kms_access_key_id = "key"
+        mock_settings.kms_secret_access_key = "secret"
+        mock_settings.kms_endpoint_url = ""
+        mock_settings.kms_envelope_enabled = True
+        mock_settings.kms_data_key_max_age_seconds = 60
+        mock_settings.kms_data_key_max_uses = 5
+        mock_settings.kms_data_key_cache_entries = 7
+
+        with patch("rentivo.aws.boto3"):
+            from rentivo.encryption.factory import get_encryption
+
+            backend = get_encryption()
+
+        assert backend.envelope is True
+        keys = backend._keys()
+        assert (keys.max_age_seconds, keys.max_uses, keys.max_entries) == (60, 5, 7)
 
     @patch("rentivo.encryption.factory.settings")
     def test_unsupported_backend(self, mock_settings):
@@ -215,7 +215,8 @@ class TestKMSBackend:
         assert backend.is_encrypted(CIPHERTEXT_PREFIX + "anything") is True
         assert backend.is_encrypted("plaintext") is False
         assert backend.is_encrypted("") is False
-        assert backend.is_encrypted("enc:v2:future") is False  # different version
+        assert backend.is_encrypted("enc:v2:envelope") is True
+        assert backend.is_encrypted("enc:v3:future") is False  # unknown version
 
     @patch("rentivo.aws.boto3")
     def test_endpoint_url_passed(self, mock_boto3):
@@ -339,3 +340,335 @@ class TestKMSBackendDecryptMany:
         result = backend.decrypt_many(["", "raw plaintext", b64])
         assert result == ["", "raw plaintext", "hello"]
         mock_client.decrypt.assert_not_called()
+
+
+class _Throttled(Exception):
+    def __init__(self, code: str = "ThrottlingException") -> None:
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+def _fake_backend(client):
+    from rentivo.encryption.kms import KMSBackend
+
+    backend = KMSBackend.__new__(KMSBackend)
+    backend.key_id = "alias/rentivo"
+    backend.client = client
+    return backend
+
+
+_TOKEN = CIPHERTEXT_PREFIX + base64.b64encode(b"blob").decode("ascii")
+
+
+class TestKMSSharedConcurrency:
+    @pytest.fixture(autouse=True)
+    def _metrics(self, monkeypatch):
+        from rentivo.encryption import kms as kms_module
+        from rentivo.observability import metrics
+
+        metrics._reset_for_tests()
+        monkeypatch.setattr(kms_module, "_THROTTLE_BACKOFF_SECONDS", 0)
+        yield metrics
+        metrics._reset_for_tests()
+
+    def test_decrypt_many_reuses_one_process_wide_pool_across_backends(self):
+        from rentivo.encryption import kms as kms_module
+
+        client = MagicMock()
+        client.decrypt.return_value = {"Plaintext": b"ok"}
+
+        _fake_backend(client).decrypt_many([_TOKEN])
+        pool = kms_module._pool
+        _fake_backend(client).decrypt_many([_TOKEN, _TOKEN])
+
+        assert pool is not None
+        assert kms_module._pool is pool
+
+    def test_pool_and_limit_follow_the_in_flight_setting(self, monkeypatch):
+        from rentivo.encryption import kms as kms_module
+
+        monkeypatch.setattr(kms_module.settings, "kms_max_in_flight", 3)
+        pool, limiter = kms_module._shared()
+
+        assert pool._max_workers == 3
+        assert limiter.max_limit == 3
+
+    def test_in_flight_calls_never_exceed_the_global_limit(self, monkeypatch):
+        import threading
+        import time
+
+        from rentivo.encryption import kms as kms_module
+
+        monkeypatch.setattr(kms_module.settings, "kms_max_in_flight", 2)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def fake_decrypt(**_kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return {"Plaintext": b"ok"}
+
+        client = MagicMock()
+        client.decrypt.side_effect = fake_decrypt
+        backend = _fake_backend(client)
+        threads = [threading.Thread(target=backend.decrypt_many, args=([_TOKEN] * 4,)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert client.decrypt.call_count == 12
+        assert peak <= 2
+
+    def test_records_queue_wait_and_rtt_separately(self, _metrics):
+        client = MagicMock()
+        client.decrypt.return_value = {"Plaintext": b"ok"}
+        client.encrypt.return_value = {"CiphertextBlob": b"blob"}
+        backend = _fake_backend(client)
+
+        backend.decrypt_many([_TOKEN, _TOKEN])
+        backend.encrypt("hello")
+
+        summaries = {(row["name"], row["labels"]["operation"]): row for row in _metrics.snapshot()["summaries"]}
+        assert summaries["kms.queue_wait_seconds", "decrypt"]["count"] == 2
+        assert summaries["kms.rtt_seconds", "decrypt"]["count"] == 2
+        assert summaries["kms.queue_wait_seconds", "encrypt"]["count"] == 1
+        assert summaries["kms.rtt_seconds", "encrypt"]["count"] == 1
+
+    def test_throttling_backs_off_the_limit_and_retries(self, _metrics):
+        import structlog
+
+        from rentivo.encryption import kms as kms_module
+
+        client = MagicMock()
+        client.decrypt.side_effect = [_Throttled(), {"Plaintext": b"ok"}]
+
+        with structlog.testing.capture_logs() as logs:
+            assert _fake_backend(client).decrypt(_TOKEN) == "ok"
+
+        _, limiter = kms_module._shared()
+        assert limiter.limit == kms_module.settings.kms_max_in_flight // 2
+        assert [entry["event"] for entry in logs if entry["log_level"] == "warning"] == ["kms_throttled"]
+        counters = _metrics.snapshot()["counters"]
+        assert counters == [{"name": "kms.throttled", "labels": {"operation": "decrypt"}, "value": 1}]
+        gauges = _metrics.snapshot()["gauges"]
+        assert gauges == [{"name": "kms.concurrency_limit", "labels": {}, "value": limiter.limit}]
+
+    def test_throttling_past_the_retry_budget_propagates(self):
+        from rentivo.encryption import kms as kms_module
+
+        client = MagicMock()
+        client.decrypt.side_effect = _Throttled()
+
+        with pytest.raises(_Throttled):
+            _fake_backend(client).decrypt(_TOKEN)
+
+        assert client.decrypt.call_count == kms_module._THROTTLE_RETRIES + 1
+        assert kms_module._shared()[1].in_flight == 0
+
+    @pytest.mark.parametrize("error", [RuntimeError("boom"), _Throttled("AccessDeniedException")])
+    def test_other_errors_propagate_without_retry_or_backoff(self, error):
+        from rentivo.encryption import kms as kms_module
+
+        client = MagicMock()
+        client.decrypt.side_effect = error
+
+        with pytest.raises(type(error)):
+            _fake_backend(client).decrypt(_TOKEN)
+
+        limiter = kms_module._shared()[1]
+        assert client.decrypt.call_count == 1
+        assert limiter.limit == limiter.max_limit
+        assert limiter.in_flight == 0
+
+
+class _FakeEnvelopeKMS:
+    """KMS stand-in for envelope tests: real AES data keys, deterministic wrapping."""
+
+    def __init__(self) -> None:
+        self.store: dict[bytes, bytes] = {}
+        self.calls: list[str] = []
+
+    def generate_data_key(self, *, KeyId, KeySpec):
+        import os
+
+        assert KeySpec == "AES_256"
+        self.calls.append("generate_data_key")
+        plaintext = os.urandom(32)
+        blob = b"WRAPPED-%d" % len(self.store)
+        self.store[blob] = plaintext
+        return {"Plaintext": plaintext, "CiphertextBlob": blob}
+
+    def encrypt(self, *, KeyId, Plaintext):
+        self.calls.append("encrypt")
+        blob = b"BLOB-" + Plaintext
+        self.store[blob] = Plaintext
+        return {"CiphertextBlob": blob}
+
+    def decrypt(self, *, CiphertextBlob, KeyId):
+        self.calls.append("decrypt")
+        return {"Plaintext": self.store[CiphertextBlob]}
+
+
+class TestKMSEnvelope:
+    @staticmethod
+    def _backend(client, *, envelope=True, **bounds):
+        with patch("rentivo.aws.boto3") as mock_boto3:
+            mock_boto3.client.return_value = client
+            from rentivo.encryption.kms import KMSBackend
+
+            return KMSBackend(
+                key_id="alias/rentivo",
+                region="us-east-1",
+                access_key_id="k",
+                secret_access_key="s",
+                envelope=envelope,
+                **bounds,
+            )
+
+    def test_envelope_writes_v2_with_one_data_key_for_many_values(self):
+        client = _FakeEnvelopeKMS()
+        backend = self._backend(client)
+
+        tokens = [backend.encrypt(f"value-{i}") for i in range(5)]
+
+        assert all(token.startswith("enc:v2:") for token in tokens)
+        assert client.calls == ["generate_data_key"]
+        assert [backend.decrypt(token) for token in tokens] == [f"value-{i}" for i in range(5)]
+        assert client.calls == ["generate_data_key"]
+
+    def test_data_key_rotates_after_its_use_budget(self):
+        client = _FakeEnvelopeKMS()
+        backend = self._backend(client, data_key_max_uses=2)
+
+        for i in range(3):
+            backend.encrypt(f"value-{i}")
+
+        assert client.calls == ["generate_data_key", "generate_data_key"]
+
+    def test_cold_process_unwraps_each_data_key_once_per_batch(self):
+        client = _FakeEnvelopeKMS()
+        writer = self._backend(client, data_key_max_uses=2)
+        tokens = [writer.encrypt(f"value-{i}") for i in range(4)]  # two data keys
+        reader = self._backend(client)
+        client.calls.clear()
+
+        assert reader.decrypt_many(tokens + tokens) == [f"value-{i}" for i in range(4)] * 2
+        assert client.calls == ["decrypt", "decrypt"]
+
+        client.calls.clear()
+        assert reader.decrypt_many(tokens) == [f"value-{i}" for i in range(4)]
+        assert client.calls == []
+
+    def test_v2_reads_coexist_with_v1_base64_and_plaintext_rows(self):
+        client = _FakeEnvelopeKMS()
+        v1 = self._backend(client, envelope=False).encrypt("legacy")
+        backend = self._backend(client)
+        v2 = backend.encrypt("current")
+        b64 = "b64:v1:" + base64.b64encode(b"transitional").decode("ascii")
+
+        assert v1.startswith(CIPHERTEXT_PREFIX)
+        assert backend.decrypt_many(["", "plain", b64, v1, v2]) == ["", "plain", "transitional", "legacy", "current"]
+        assert backend.decrypt(v1) == "legacy"
+
+    def test_encrypt_is_idempotent_on_either_kms_format(self):
+        client = _FakeEnvelopeKMS()
+        v1 = self._backend(client, envelope=False).encrypt("legacy")
+        backend = self._backend(client)
+        v2 = backend.encrypt("current")
+
+        assert backend.encrypt(v1) == v1
+        assert backend.encrypt(v2) == v2
+        assert backend.is_encrypted(v1) and backend.is_encrypted(v2)
+
+    def test_is_current_tracks_the_write_format(self):
+        client = _FakeEnvelopeKMS()
+        direct = self._backend(client, envelope=False)
+        envelope = self._backend(client)
+        v1, v2 = direct.encrypt("a"), envelope.encrypt("b")
+
+        assert direct.is_current(v1) and direct.is_current(v2)
+        assert not envelope.is_current(v1)
+        assert envelope.is_current(v2)
+        assert not envelope.is_current("b64:v1:YQ==")
+
+    def test_backend_built_without_init_lazily_gets_a_data_key_cache(self):
+        from rentivo.encryption.kms import KMSBackend
+
+        backend = KMSBackend.__new__(KMSBackend)
+        backend.key_id = "alias/rentivo"
+        backend.client = _FakeEnvelopeKMS()
+        backend.envelope = True
+
+        assert backend.decrypt(backend.encrypt("x")) == "x"
+
+
+class TestKMSEncryptMany:
+    def test_direct_mode_fans_encrypts_out_in_parallel(self):
+        import threading
+
+        n = 6
+        barrier = threading.Barrier(n, timeout=2.0)
+
+        class Client(_FakeEnvelopeKMS):
+            def encrypt(self, *, KeyId, Plaintext):
+                barrier.wait()
+                return super().encrypt(KeyId=KeyId, Plaintext=Plaintext)
+
+        client = Client()
+        backend = TestKMSEnvelope._backend(client, envelope=False)
+
+        tokens = backend.encrypt_many([f"v{i}" for i in range(n)])
+
+        assert all(token.startswith(CIPHERTEXT_PREFIX) for token in tokens)
+        assert backend.decrypt_many(tokens) == [f"v{i}" for i in range(n)]
+
+    def test_passthroughs_keep_their_position_and_skip_kms(self):
+        client = _FakeEnvelopeKMS()
+        backend = TestKMSEnvelope._backend(client, envelope=False)
+        already = backend.encrypt("done")
+        client.calls.clear()
+
+        tokens = backend.encrypt_many(["", "a", already, "b"])
+
+        assert tokens[0] == ""
+        assert tokens[2] == already
+        assert backend.decrypt(tokens[1]) == "a" and backend.decrypt(tokens[3]) == "b"
+        assert client.calls.count("encrypt") == 2
+
+    def test_single_pending_value_stays_on_the_calling_thread(self):
+        import threading
+
+        caller = threading.get_ident()
+        seen: list[int] = []
+
+        class Client(_FakeEnvelopeKMS):
+            def encrypt(self, *, KeyId, Plaintext):
+                seen.append(threading.get_ident())
+                return super().encrypt(KeyId=KeyId, Plaintext=Plaintext)
+
+        backend = TestKMSEnvelope._backend(Client(), envelope=False)
+
+        backend.encrypt_many(["", "only"])
+
+        assert seen == [caller]
+
+    def test_envelope_mode_seals_the_batch_under_one_data_key(self):
+        client = _FakeEnvelopeKMS()
+        backend = TestKMSEnvelope._backend(client)
+
+        tokens = backend.encrypt_many(["a", "b", "c"])
+
+        assert all(token.startswith("enc:v2:") for token in tokens)
+        assert client.calls == ["generate_data_key"]
+
+    def test_empty_batch_is_a_no_op(self):
+        client = _FakeEnvelopeKMS()
+
+        assert TestKMSEnvelope._backend(client).encrypt_many([]) == []
+        assert client.calls == []
@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from rentivo.encryption.limiter import AdaptiveLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limiter(max_limit: int = 8, **kwargs) -> tuple[AdaptiveLimiter, FakeClock]:
+    clock = FakeClock()
+    return AdaptiveLimiter(max_limit, clock=clock, **kwargs), clock
+
+
+def test_starts_at_the_ceiling_and_tracks_in_flight() -> None:
+    limiter, _ = _limiter()
+
+    limiter.acquire()
+    limiter.acquire()
+
+    assert limiter.limit == 8
+    assert limiter.in_flight == 2
+
+
+def test_throttle_halves_the_limit_once_per_cooldown() -> None:
+    limiter, clock = _limiter(cooldown_seconds=1.0)
+    for _ in range(3):
+        limiter.acquire()
+
+    limiter.release(throttled=True)
+    limiter.release(throttled=True)  # same burst: already backed off
+    assert limiter.limit == 4
+
+    clock.now = 1.0
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+def test_throttle_never_drops_below_the_floor() -> None:
+    limiter, clock = _limiter(max_limit=4, min_limit=2, cooldown_seconds=0)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(throttled=True)
+        clock.now += 1
+
+    assert limiter.limit == 2
+
+
+def test_clean_releases_grow_the_limit_additively_up_to_the_ceiling() -> None:
+    limiter, _ = _limiter(max_limit=4, cooldown_seconds=0)
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 3
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 4
+
+
+def test_acquire_blocks_at_the_limit_until_a_slot_is_released() -> None:
+    limiter, _ = _limiter(max_limit=1)
+    limiter.acquire()
+    entered = threading.Event()
+
+    def waiter() -> None:
+        limiter.acquire()
+        entered.set()
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    assert not entered.wait(0.05)
+
+    limiter.release()
+    assert entered.wait(1.0)
+    thread.join()
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.parametrize(("max_limit", "min_limit"), [(0, 1), (4, 0), (2, 3)])
+def test_rejects_inconsistent_bounds(max_limit: int, min_limit: int) -> None:
+    with pytest.raises(ValueError, match="min_limit"):
+        AdaptiveLimiter(max_limit, min_limit=min_limit)
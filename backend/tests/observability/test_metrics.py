@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from rentivo.observability import metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics._reset_for_tests()
+    yield
+    metrics._reset_for_tests()
+
+
+def test_counters_accumulate_per_label_set() -> None:
+    metrics.increment("jobs.claimed", job_type="pdf.render")
+    metrics.increment("jobs.claimed", 2, job_type="pdf.render")
+    metrics.increment("jobs.claimed", job_type="s3.delete")
+
+    assert sorted(metrics.snapshot()["counters"], key=lambda row: row["labels"]["job_type"]) == [
+        {"name": "jobs.claimed", "labels": {"job_type": "pdf.render"}, "value": 3},
+        {"name": "jobs.claimed", "labels": {"job_type": "s3.delete"}, "value": 1},
+    ]
+
+
+def test_label_order_does_not_split_a_series() -> None:
+    metrics.increment("x", a="1", b="2")
+    metrics.increment("x", b="2", a="1")
+
+    assert metrics.snapshot()["counters"] == [{"name": "x", "labels": {"a": "1", "b": "2"}, "value": 2}]
+
+
+def test_gauges_keep_the_latest_value_and_stringify_labels() -> None:
+    metrics.set_gauge("db.pool.checked_out", 3, pool=1)
+    metrics.set_gauge("db.pool.checked_out", 1, pool=1)
+
+    assert metrics.snapshot()["gauges"] == [{"name": "db.pool.checked_out", "labels": {"pool": "1"}, "value": 1}]
+
+
+def test_summaries_track_count_sum_and_max() -> None:
+    for value in (0.5, 2.0, 1.0):
+        metrics.observe("wait", value)
+
+    assert metrics.snapshot()["summaries"] == [{"name": "wait", "labels": {}, "count": 3, "sum": 3.5, "max": 2.0}]
+
+
+def test_concurrent_increments_are_not_lost() -> None:
+    def hammer() -> None:
+        for _ in range(1000):
+            metrics.increment("hits")
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.snapshot()["counters"] == [{"name": "hits", "labels": {}, "value": 8000}]
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.exc import OperationalError
 
 from rentivo.constants import SP_TZ
@@ -298,39 +298,96 @@ class TestBillRepoEdgeCases:
     def _create_billing(self, billing_repo, sample_billing):
         return billing_repo.create(sample_billing())
 
-    def test_create_runtime_error(self, bill_repo, billing_repo, sample_billing, sample_bill):
+    def test_create_and_update_return_plaintext_without_re_reading(
+        self, db_connection, fake_encryption, billing_repo, sample_billing, sample_bill
+    ):
         billing = self._create_billing(billing_repo, sample_billing)
-        bill = sample_bill(billing_id=billing.id)
-        with patch.object(bill_repo, "get_by_id", return_value=None):
-            with pytest.raises(RuntimeError, match="Failed to retrieve bill after create"):
-                bill_repo.create(bill)
+        encryption = MagicMock(wraps=fake_encryption)
+        repo = SQLAlchemyBillRepository(db_connection, encryption)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split()[0])
+
+        event.listen(db_connection, "before_cursor_execute", record)
+        try:
+            created = repo.create(sample_bill(billing_id=billing.id))
+            create_statements = list(statements)
+            statements.clear()
+            created.notes = "Updated"
+            created.line_items.append(BillLineItem(description="Extra", amount=1000, item_type=ItemType.EXTRA))
+            updated = repo.update(created)
+        finally:
+            event.remove(db_connection, "before_cursor_execute", record)
+
+        encryption.decrypt_many.assert_not_called()
+        encryption.decrypt.assert_not_called()
+        assert create_statements == ["INSERT", "INSERT", "SELECT"]
+        assert statements == ["UPDATE", "DELETE", "INSERT", "SELECT", "SELECT"]
+        assert updated.mutation_revision == 1
+        assert [item.description for item in updated.line_items] == ["Aluguel", "Água", "Extra"]
+        assert [item.sort_order for item in updated.line_items] == [0, 1, 2]
+        assert updated == repo.get_by_id(created.id)
+
+    def test_create_returns_the_same_bill_a_read_would(self, bill_repo, billing_repo, sample_billing, sample_bill):
+        billing = self._create_billing(billing_repo, sample_billing)
+        created = bill_repo.create(sample_bill(billing_id=billing.id))
+
+        assert created == bill_repo.get_by_id(created.id)
 
-    def test_create_rolls_back_insert_and_line_items_when_hydration_fails(
+    def test_create_without_line_items_skips_the_item_insert(
+        self, bill_repo, billing_repo, sample_billing, sample_bill
+    ):
+        billing = self._create_billing(billing_repo, sample_billing)
+        created = bill_repo.create(sample_bill(billing_id=billing.id, line_items=[]))
+
+        assert created.line_items == []
+        assert bill_repo.get_by_id(created.id).line_items == []
+
+    def test_create_rolls_back_insert_when_line_items_fail(
         self,
         db_connection,
-        fake_encryption,
+        bill_repo,
         billing_repo,
         sample_billing,
         sample_bill,
     ):
         billing = self._create_billing(billing_repo, sample_billing)
-        failing_encryption = MagicMock(wraps=fake_encryption)
-        failing_encryption.decrypt_many.side_effect = RuntimeError("decrypt failed")
-        repo = SQLAlchemyBillRepository(db_connection, failing_encryption)
 
-        with pytest.raises(RuntimeError, match="decrypt failed"):
-            repo.create(sample_bill(billing_id=billing.id))
+        with patch.object(bill_repo, "_insert_line_items", side_effect=RuntimeError("insert failed")):
+            with pytest.raises(RuntimeError, match="insert failed"):
+                bill_repo.create(sample_bill(billing_id=billing.id))
 
         assert db_connection.execute(text("SELECT COUNT(*) FROM bills")).scalar_one() == 0
         assert db_connection.execute(text("SELECT COUNT(*) FROM bill_line_items")).scalar_one() == 0
 
-    def test_update_runtime_error(self, bill_repo, billing_repo, sample_billing, sample_bill):
+    def test_writes_encrypt_every_field_in_one_batch(
+        self, db_connection, fake_encryption, billing_repo, sample_billing, sample_bill
+    ):
+        billing = self._create_billing(billing_repo, sample_billing)
+        encryption = MagicMock(wraps=fake_encryption)
+        repo = SQLAlchemyBillRepository(db_connection, encryption)
+
+        created = repo.create(sample_bill(billing_id=billing.id))
+        created.notes = "Updated"
+        repo.update(created)
+
+        assert encryption.encrypt.call_count == 0
+        assert [call.args[0] for call in encryption.encrypt_many.call_args_list] == [
+            ["Test note", "Aluguel", "Água"],
+            ["Updated", "Aluguel", "Água"],
+        ]
+
+    def test_update_runtime_error(self, db_connection, bill_repo, billing_repo, sample_billing, sample_bill):
         billing = self._create_billing(billing_repo, sample_billing)
         created = bill_repo.create(sample_bill(billing_id=billing.id))
+        bill_repo.delete(created.id)
         created.notes = "Updated"
-        with patch.object(bill_repo, "get_by_id", return_value=None):
-            with pytest.raises(RuntimeError, match="Failed to retrieve bill after update"):
-                bill_repo.update(created)
+        with pytest.raises(RuntimeError, match="Failed to retrieve bill after update"):
+            bill_repo.update(created)
+
+        row = db_connection.execute(text("SELECT mutation_revision FROM bills WHERE id = :id"), {"id": created.id})
+        assert row.scalar_one() == 0
 
 
 class TestBillRepoPdfRenderStatus:
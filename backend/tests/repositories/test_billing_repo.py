@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlalchemy.exc import IntegrityError
@@ -36,6 +36,24 @@ class TestBillingRepoCRUD:
         assert db_connection.exec_driver_sql("SELECT COUNT(*) FROM billing_recipients").scalar_one() == 0
         assert db_connection.exec_driver_sql("SELECT COUNT(*) FROM billing_reply_to").scalar_one() == 0
 
+    def test_aggregate_writes_batch_their_encryption(self, db_connection, fake_encryption, sample_billing):
+        encryption = MagicMock(wraps=fake_encryption)
+        repo = SQLAlchemyBillingRepository(db_connection, encryption)
+        recipients = [Recipient(billing_id=0, name="Ana", email="ana@example.com")]
+
+        created = repo.create_aggregate(sample_billing(), recipients=recipients, reply_to=None)
+        repo.update_aggregate(created, recipients=recipients, reply_to=None)
+
+        encryption.encrypt.assert_not_called()
+        batches = [call.args[0] for call in encryption.encrypt_many.call_args_list]
+        core = [created.name, created.description, created.pix_key, created.pix_merchant_name]
+        assert batches[0][:4] == core
+        assert batches[0][5:] == [item.description for item in created.items]
+        assert batches[1] == ["Ana", "ana@example.com"]
+        assert batches[2][:4] == core
+        assert batches[3] == ["Ana", "ana@example.com"]
+        assert len(batches) == 4
+
     def test_create_and_get(self, billing_repo: SQLAlchemyBillingRepository, sample_billing):
         billing = sample_billing()
         created = billing_repo.create(billing)
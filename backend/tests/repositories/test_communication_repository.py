@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from unittest.mock import MagicMock
 
 import pytest
 from sqlalchemy import create_engine, text
@@ -120,6 +121,34 @@ def test_communication_create_batch_and_batch_status_updates(conn):
     assert {row.error for row in rows} == {"queue down"}
 
 
+def test_communication_create_batch_encrypts_every_row_in_one_call(conn):
+    encryption = MagicMock(wraps=Base64Backend())
+    repo = SQLAlchemyCommunicationRepository(conn, encryption)
+
+    created = repo.create_batch(
+        [
+            Communication(
+                bill_id=5,
+                comm_type="bill_ready",
+                recipient_name=name,
+                recipient_email=f"{name.lower()}@x.com",
+                subject=f"s-{name}",
+                body_markdown=f"b-{name}",
+            )
+            for name in ("Ana", "Bia")
+        ]
+    )
+
+    encryption.encrypt.assert_not_called()
+    encryption.encrypt_many.assert_called_once_with(
+        ["Ana", "ana@x.com", "s-Ana", "b-Ana", "Bia", "bia@x.com", "s-Bia", "b-Bia"]
+    )
+    assert [(row.recipient_name, row.subject, row.body_markdown) for row in created] == [
+        ("Ana", "s-Ana", "b-Ana"),
+        ("Bia", "s-Bia", "b-Bia"),
+    ]
+
+
 def test_empty_communication_batches_are_noops(conn):
     repo = SQLAlchemyCommunicationRepository(conn, Base64Backend())
     assert repo.create_batch([]) == []
@@ -122,6 +122,21 @@ class TestOrganizationRepoCRUD:
         user = _create_user(user_repo)
         assert org_repo.list_by_user(user.id) == []
 
+    def test_list_by_ids_returns_live_organizations_with_decrypted_pix(self, org_repo, user_repo):
+        user = _create_user(user_repo)
+        kept = org_repo.create(Organization(name="Kept", created_by=user.id, pix_key="kept@pix.com"))
+        deleted = org_repo.create(Organization(name="Deleted", created_by=user.id))
+        org_repo.delete(deleted.id)
+
+        orgs = org_repo.list_by_ids({kept.id, deleted.id, 9999})
+
+        assert [(org.id, org.pix_key) for org in orgs] == [(kept.id, "kept@pix.com")]
+
+    def test_list_by_ids_empty_skips_the_query(self, org_repo):
+        with patch.object(org_repo.conn, "execute") as execute:
+            assert org_repo.list_by_ids([]) == []
+        execute.assert_not_called()
+
 
 class TestOrganizationMemberOps:
     def test_add_and_get_member(self, org_repo, user_repo):
@@ -131,6 +146,22 @@ class TestOrganizationMemberOps:
         assert member.user_id == user.id
         assert member.role == "admin"
 
+    def test_list_memberships_for_user_spans_organizations(self, org_repo, user_repo):
+        user = _create_user(user_repo)
+        other = _create_user(user_repo, email="other@example.com")
+        first = org_repo.create(Organization(name="First", created_by=user.id))
+        second = org_repo.create(Organization(name="Second", created_by=user.id))
+        org_repo.add_member(first.id, user.id, "admin")
+        org_repo.add_member(second.id, user.id, "viewer")
+        org_repo.add_member(second.id, other.id, "admin")
+
+        memberships = org_repo.list_memberships_for_user(user.id)
+
+        assert [(member.organization_id, member.role) for member in memberships] == [
+            (first.id, "admin"),
+            (second.id, "viewer"),
+        ]
+
     def test_get_member_not_found(self, org_repo, user_repo):
         user = _create_user(user_repo)
         org = org_repo.create(Organization(name="Test", created_by=user.id))
@@ -115,3 +115,51 @@ def test_full_rollout_base64_to_kms_via_backfill(db_connection, kms_mock):
         # The KMS decrypt was called now that rows are enc:v1:.
         # 3 PIX columns + 1 email column (also backfilled to enc:v1:) = 4 calls.
         assert kms_mock.decrypt.call_count == 4
+
+
+def test_envelope_rollout_migrates_v1_rows_to_v2(db_connection, kms_mock):
+    """RENTIVO_KMS_ENVELOPE_ENABLED=true + backfill: enc:v1 rows become enc:v2
+    and then read back without any KMS Decrypt on a warm process."""
+    keys: dict[bytes, bytes] = {}
+
+    def fake_generate_data_key(KeyId, KeySpec):
+        plaintext = bytes(range(32))
+        keys[b"WRAPPED"] = plaintext
+        return {"Plaintext": plaintext, "CiphertextBlob": b"WRAPPED"}
+
+    kms_mock.generate_data_key.side_effect = fake_generate_data_key
+    with patch("rentivo.aws.boto3") as mock_boto3:
+        mock_boto3.client.return_value = kms_mock
+        direct = KMSBackend(key_id="alias/rentivo", region="us-east-1", access_key_id="k", secret_access_key="s")
+        direct_repo = SQLAlchemyUserRepository(db_connection, direct)
+        user = direct_repo.create(User(email="bob@example.com", password_hash="x"))
+        direct_repo.update_pix(user.id, "bob@pix.com", "Bob", "Recife")
+        envelope = KMSBackend(
+            key_id="alias/rentivo",
+            region="us-east-1",
+            access_key_id="k",
+            secret_access_key="s",
+            envelope=True,
+        )
+
+        backfill_encryption.run(db_connection, envelope, dry_run=False)
+
+        raw = (
+            db_connection.execute(text("SELECT email, pix_key FROM users WHERE id = :id"), {"id": user.id})
+            .mappings()
+            .fetchone()
+        )
+        assert raw["email"].startswith("enc:v2:")
+        assert raw["pix_key"].startswith("enc:v2:")
+        kms_mock.generate_data_key.assert_called_once()
+
+        kms_mock.decrypt.reset_mock()
+        fetched = SQLAlchemyUserRepository(db_connection, envelope).get_by_id(user.id)
+        assert fetched is not None
+        assert fetched.email == "bob@example.com"
+        assert fetched.pix_key == "bob@pix.com"
+        kms_mock.decrypt.assert_not_called()
+
+        # A second pass finds nothing left to migrate.
+        backfill_encryption.run(db_connection, envelope, dry_run=False)
+        kms_mock.generate_data_key.assert_called_once()
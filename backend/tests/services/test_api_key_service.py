@@ -568,6 +568,22 @@ def test_integration_access_requires_matching_grant_and_live_membership(
     assert service.can_access_resource(key, "organization", 42) is False
 
 
+def test_grants_resource_checks_scope_without_querying_membership(
+    service: APIKeyService,
+    organization_repository: MagicMock,
+) -> None:
+    key = service.issue_integration(
+        **_integration_args(grants=[APIKeyGrant(resource_type="organization", resource_id=42)])
+    ).key
+    organization_repository.reset_mock()
+
+    assert service.grants_resource(key, "organization", 42) is True
+    assert service.grants_resource(key, "organization", 43) is False
+    assert service.grants_resource(key, "user", 7) is False
+    organization_repository.get_by_id.assert_not_called()
+    organization_repository.get_member.assert_not_called()
+
+
 def test_resource_access_rejects_unknown_resource_type(service: APIKeyService) -> None:
     key = service.issue_login(user_id=7, name="Web login").key
 
@@ -10,6 +10,33 @@ class TestAuthorizationService:
         self.mock_org_repo = MagicMock()
         self.service = AuthorizationService(self.mock_org_repo)
 
+    def test_roles_for_billings_resolve_memberships_in_one_query(self):
+        self.mock_org_repo.list_memberships_for_user.return_value = [
+            OrganizationMember(organization_id=10, user_id=2, role="manager"),
+            OrganizationMember(organization_id=11, user_id=2, role="viewer"),
+        ]
+        billings = [
+            Billing(id=1, name="Own", owner_type="user", owner_id=2),
+            Billing(id=2, name="Foreign", owner_type="user", owner_id=3),
+            Billing(id=3, name="Org", owner_type="organization", owner_id=10),
+            Billing(id=4, name="Org again", owner_type="organization", owner_id=10),
+            Billing(id=5, name="Other org", owner_type="organization", owner_id=11),
+            Billing(id=6, name="Not a member", owner_type="organization", owner_id=12),
+            Billing(name="Unsaved", owner_type="user", owner_id=2),
+        ]
+
+        roles = self.service.get_roles_for_billings(2, billings)
+
+        assert roles == {1: "owner", 3: "manager", 4: "manager", 5: "viewer"}
+        self.mock_org_repo.list_memberships_for_user.assert_called_once_with(2)
+        self.mock_org_repo.get_member.assert_not_called()
+
+    def test_roles_for_personal_billings_skip_the_membership_query(self):
+        roles = self.service.get_roles_for_billings(2, [Billing(id=1, name="Own", owner_type="user", owner_id=2)])
+
+        assert roles == {1: "owner"}
+        self.mock_org_repo.list_memberships_for_user.assert_not_called()
+
     def test_owner_can_view(self):
         billing = Billing(name="Test", owner_type="user", owner_id=1)
         assert self.service.can_view_billing(1, billing) is True
@@ -48,6 +48,14 @@ class TestOrganizationService:
         result = self.service.get_by_id(1)
         assert result.name == "Test Org"
 
+    def test_get_many_keys_live_organizations_by_id(self):
+        self.mock_repo.list_by_ids.return_value = [Organization(id=1, name="A"), Organization(id=3, name="C")]
+
+        result = self.service.get_many({1, 2, 3})
+
+        assert {org_id: org.name for org_id, org in result.items()} == {1: "A", 3: "C"}
+        self.mock_repo.list_by_ids.assert_called_once_with({1, 2, 3})
+
     def test_get_by_uuid(self):
         self.mock_repo.get_by_uuid.return_value = Organization(id=1, name="Test Org", uuid="abc")
         result = self.service.get_by_uuid("abc")
@@ -162,3 +162,13 @@ class TestOwnerConfigMemoization:
         assert all(r == PixConfig("owner@pix", "Owner", "Sao Paulo") for r in results)
         # Five resolves, one owner fetch.
         service.user_repo.get_by_id.assert_called_once_with(1)
+
+    def test_primed_organizations_are_not_refetched(self):
+        service = _make_service()
+        org = Organization(id=5, name="Org", pix_key="org@pix", pix_merchant_name="Org", pix_merchant_city="Sao Paulo")
+        service.prime_organizations([org, Organization(name="Unsaved")])
+
+        billing = Billing(id=10, name="Apt", owner_type="organization", owner_id=5)
+
+        assert service.resolve_for_billing(billing) == PixConfig("org@pix", "Org", "Sao Paulo")
+        service.org_repo.get_by_id.assert_not_called()
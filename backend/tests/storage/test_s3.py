@@ -212,3 +212,25 @@ class TestS3Storage:
             ContentType="image/jpeg",
         )
         assert result == "path/to/img.jpg"
+
+
+@patch("rentivo.aws.boto3")
+def test_storages_with_the_same_config_share_one_client(mock_boto3):
+    mock_boto3.client.side_effect = lambda **_: MagicMock()
+
+    from rentivo.storage.factory import get_storage
+
+    with patch.multiple(
+        "rentivo.storage.factory.settings",
+        storage_backend="s3",
+        s3_bucket="b",
+        s3_region="r",
+        s3_access_key_id="k",
+        s3_secret_access_key="s",
+        s3_endpoint_url="",
+    ):
+        first, second = get_storage(), get_storage()
+
+    assert first is not second
+    assert first.client is second.client
+    mock_boto3.client.assert_called_once()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 import rentivo.aws as aws_module
-from rentivo.aws import build_client
+from rentivo.aws import build_client, shared_client
 
 
 class TestBuildClientKwargs:
@@ -110,3 +111,98 @@ class TestBuildClientMissingBoto3:
                     endpoint_url="http://localstack:4566",
                     feature="SES email",
                 )
+
+
+class TestBuildClientPoolSize:
+    @patch("rentivo.aws.boto3")
+    def test_forwards_max_pool_connections_as_botocore_config(self, mock_boto3):
+        build_client(
+            "s3",
+            region="us-east-1",
+            access_key_id="key",
+            secret_access_key="secret",
+            feature="S3 storage",
+            max_pool_connections=64,
+        )
+
+        assert mock_boto3.client.call_args.kwargs["config"].max_pool_connections == 64
+
+
+class TestSharedClient:
+    @staticmethod
+    def _shared(service: str = "s3", **overrides):
+        kwargs = {
+            "region": "us-east-1",
+            "access_key_id": "key",
+            "secret_access_key": "secret",
+            "endpoint_url": "",
+            "feature": "S3 storage",
+        }
+        kwargs.update(overrides)
+        return shared_client(service, **kwargs)
+
+    @patch("rentivo.aws.boto3")
+    def test_same_key_reuses_one_client(self, mock_boto3):
+        mock_boto3.client.side_effect = lambda **_: MagicMock()
+
+        first = self._shared()
+        second = self._shared()
+
+        assert first is second
+        mock_boto3.client.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("service", "overrides"),
+        [
+            ("ses", {}),
+            ("s3", {"region": "sa-east-1"}),
+            ("s3", {"endpoint_url": "http://localstack:4566"}),
+            ("s3", {"access_key_id": "other"}),
+            ("s3", {"secret_access_key": "other"}),
+        ],
+    )
+    @patch("rentivo.aws.boto3")
+    def test_each_key_component_gets_its_own_client(self, mock_boto3, service, overrides):
+        mock_boto3.client.side_effect = lambda **_: MagicMock()
+
+        assert self._shared() is not self._shared(service, **overrides)
+        assert mock_boto3.client.call_count == 2
+
+    @patch("rentivo.aws.boto3")
+    def test_uses_the_configured_pool_size(self, mock_boto3, monkeypatch):
+        monkeypatch.setattr(aws_module.settings, "aws_max_pool_connections", 7)
+
+        self._shared()
+
+        assert mock_boto3.client.call_args.kwargs["config"].max_pool_connections == 7
+
+    @patch("rentivo.aws.boto3")
+    def test_concurrent_first_calls_build_once(self, mock_boto3):
+        mock_boto3.client.side_effect = lambda **_: MagicMock()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: self._shared(), range(32)))
+
+        assert all(client is clients[0] for client in clients)
+        mock_boto3.client.assert_called_once()
+
+    def test_lost_race_returns_the_winning_client(self, monkeypatch):
+        winner = MagicMock()
+
+        class RacingLock:
+            def __enter__(self):
+                aws_module._clients[("s3", "us-east-1", "", "key", "secret")] = winner
+
+            def __exit__(self, *exc):
+                return False
+
+        monkeypatch.setattr(aws_module, "_clients_lock", RacingLock())
+
+        assert self._shared() is winner
+
+    def test_missing_boto3_raises_and_caches_nothing(self):
+        with patch.object(aws_module, "boto3", None):
+            with pytest.raises(ImportError, match="S3 storage"):
+                self._shared()
+
+        assert aws_module._clients == {}
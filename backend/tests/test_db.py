@@ -1,20 +1,66 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
 
 import rentivo.api.app as api_app
 import rentivo.db as db_module
 import rentivo.workers.__main__ as worker_main
+from rentivo.observability import metrics
+from rentivo.settings import settings
+
+
+@pytest.fixture()
+def clean_metrics():
+    metrics._reset_for_tests()
+    yield
+    metrics._reset_for_tests()
+
+
+def _metric(kind: str, name: str) -> dict:
+    (row,) = [row for row in metrics.snapshot()[kind] if row["name"] == name]
+    return row
+
+
+def _queue_engine(**kwargs):
+    engine = create_engine("sqlite://", poolclass=QueuePool, **kwargs)
+    db_module.instrument_pool(engine)
+    return engine
 
 
 class TestGetEngine:
     def test_creates_engine(self, monkeypatch):
         monkeypatch.setattr(db_module, "_engine", None)
-        with patch.object(db_module, "settings") as mock_settings:
-            mock_settings.db_url = "sqlite:///:memory:"
-            engine = db_module.get_engine()
-            assert engine is not None
-            assert db_module._engine is engine
+        monkeypatch.setattr(settings, "db_url", "sqlite:///:memory:")
+        engine = db_module.get_engine()
+        assert engine is not None
+        assert db_module._engine is engine
+
+    def test_server_databases_get_the_configured_queue_pool(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_url", "mysql+pymysql://app:secret@db:3306/rentivo")
+        monkeypatch.setattr(settings, "db_pool_size", 20)
+        monkeypatch.setattr(settings, "db_pool_max_overflow", 5)
+        monkeypatch.setattr(settings, "db_pool_timeout_seconds", 2.5)
+        monkeypatch.setattr(settings, "db_pool_recycle_seconds", 600)
+        monkeypatch.setattr(settings, "db_pool_pre_ping", False)
+        monkeypatch.setattr(settings, "db_pool_lifo", True)
+
+        assert db_module._pool_options() == {
+            "pool_pre_ping": False,
+            "pool_recycle": 600,
+            "pool_size": 20,
+            "max_overflow": 5,
+            "pool_timeout": 2.5,
+            "pool_use_lifo": True,
+        }
+
+    def test_sqlite_skips_queue_pool_sizing_and_zero_recycle_disables_it(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_url", "sqlite:///:memory:")
+        monkeypatch.setattr(settings, "db_pool_recycle_seconds", 0)
+
+        assert db_module._pool_options() == {"pool_pre_ping": True, "pool_recycle": -1}
 
     def test_returns_cached_engine(self, monkeypatch):
         sentinel = MagicMock()
@@ -23,6 +69,62 @@ class TestGetEngine:
         assert engine is sentinel
 
 
+class TestPoolMetrics:
+    def test_pool_levels_and_overflow_connections_are_recorded(self, clean_metrics):
+        engine = _queue_engine(pool_size=1, max_overflow=1)
+
+        first = engine.connect()
+        second = engine.connect()
+        assert _metric("gauges", "db.pool.in_use")["value"] == 2
+        assert _metric("gauges", "db.pool.overflow")["value"] == 1
+        first.close()
+        second.close()
+
+        assert _metric("gauges", "db.pool.size")["value"] == 1
+        assert _metric("gauges", "db.pool.in_use")["value"] == 0
+        assert _metric("counters", "db.pool.overflow_connections")["value"] == 1
+
+    def test_non_queue_pools_are_not_instrumented(self, clean_metrics):
+        db_module.instrument_pool(create_engine("sqlite:///:memory:"))
+
+        assert metrics.snapshot()["gauges"] == []
+
+    def test_checkout_records_wait_and_pool_levels_on_the_span(self, clean_metrics):
+        engine = _queue_engine(pool_size=2)
+        with patch.object(db_module, "set_attributes") as set_attributes:
+            conn = db_module.checkout(engine)
+        try:
+            assert conn.execute(text("SELECT 1")).scalar_one() == 1
+        finally:
+            conn.close()
+
+        assert _metric("summaries", "db.pool.checkout_wait_seconds")["count"] == 1
+        attributes = set_attributes.call_args.kwargs
+        assert attributes["db.pool.in_use"] == 1
+        assert attributes["db.pool.overflow"] == 0
+        assert attributes["db.pool.checkout_wait_ms"] >= 0
+
+    def test_checkout_without_a_queue_pool_records_only_the_wait(self, clean_metrics):
+        with patch.object(db_module, "set_attributes") as set_attributes:
+            db_module.checkout(create_engine("sqlite:///:memory:")).close()
+
+        assert set(set_attributes.call_args.kwargs) == {"db.pool.checkout_wait_ms"}
+
+    def test_exhausted_pool_is_counted_and_logged(self, clean_metrics, monkeypatch):
+        engine = _queue_engine(pool_size=1, max_overflow=0, pool_timeout=0.01)
+        logger = MagicMock()
+        monkeypatch.setattr(db_module, "logger", logger)
+        held = engine.connect()
+        try:
+            with pytest.raises(PoolTimeoutError):
+                db_module.checkout(engine)
+        finally:
+            held.close()
+
+        assert _metric("counters", "db.pool.checkout_timeouts")["value"] == 1
+        logger.warning.assert_called_once_with("db_pool_exhausted", timeout_seconds=settings.db_pool_timeout_seconds)
+
+
 class TestGetConnection:
     def test_creates_connection(self, monkeypatch):
         monkeypatch.setattr(db_module, "_connection", None)
@@ -549,6 +549,85 @@ class TestCacheSettings:
             Settings(_env_file=None, cache_max_entries=0)
 
 
+class TestDBPoolSettings:
+    def test_defaults_match_the_previous_hard_coded_pool(self):
+        s = Settings(_env_file=None)
+        assert s.db_pool_size == 5
+        assert s.db_pool_max_overflow == 10
+        assert s.db_pool_timeout_seconds == 30.0
+        assert s.db_pool_recycle_seconds == 1800
+        assert s.db_pool_pre_ping is True
+        assert s.db_pool_lifo is False
+
+    @pytest.mark.parametrize(
+        ("overrides", "env_name"),
+        [
+            ({"db_pool_size": 0}, "RENTIVO_DB_POOL_SIZE"),
+            ({"db_pool_max_overflow": -1}, "RENTIVO_DB_POOL_MAX_OVERFLOW"),
+            ({"db_pool_recycle_seconds": -1}, "RENTIVO_DB_POOL_RECYCLE_SECONDS"),
+            ({"db_pool_timeout_seconds": 0}, "RENTIVO_DB_POOL_TIMEOUT_SECONDS"),
+        ],
+    )
+    def test_rejects_out_of_range_values(self, overrides, env_name):
+        with pytest.raises(ValidationError) as exc:
+            Settings(_env_file=None, **overrides)
+        assert env_name in str(exc.value)
+
+    def test_zero_overflow_and_recycle_are_allowed(self):
+        s = Settings(_env_file=None, db_pool_max_overflow=0, db_pool_recycle_seconds=0)
+        assert (s.db_pool_max_overflow, s.db_pool_recycle_seconds) == (0, 0)
+
+
+class TestAPIOffloadSettings:
+    def test_defaults_run_handlers_inline_and_sample_loop_lag(self):
+        s = Settings(_env_file=None)
+        assert s.api_offload_enabled is False
+        assert s.api_offload_read_workers == 32
+        assert s.api_offload_write_workers == 16
+        assert s.api_offload_auth_workers == 8
+        assert s.api_offload_render_workers == 4
+        assert s.api_loop_lag_interval_seconds == 1.0
+        assert s.api_loop_lag_warn_seconds == 0.25
+
+    def test_pool_sizes_reject_zero(self):
+        for field in (
+            "api_offload_read_workers",
+            "api_offload_write_workers",
+            "api_offload_auth_workers",
+            "api_offload_render_workers",
+        ):
+            with pytest.raises(ValidationError):
+                Settings(_env_file=None, **{field: 0})
+
+    def test_loop_lag_monitor_can_be_disabled_but_not_negative(self):
+        assert Settings(_env_file=None, api_loop_lag_interval_seconds=0).api_loop_lag_interval_seconds == 0
+        with pytest.raises(ValidationError) as exc:
+            Settings(_env_file=None, api_loop_lag_interval_seconds=-1)
+        assert "RENTIVO_API_LOOP_LAG_INTERVAL_SECONDS" in str(exc.value)
+        with pytest.raises(ValidationError) as exc:
+            Settings(_env_file=None, api_loop_lag_warn_seconds=0)
+        assert "RENTIVO_API_LOOP_LAG_WARN_SECONDS" in str(exc.value)
+
+
+class TestAWSConcurrencySettings:
+    def test_defaults(self):
+        s = Settings(_env_file=None)
+        assert s.aws_max_pool_connections == 32
+        assert s.kms_max_in_flight == 32
+
+    @pytest.mark.parametrize(
+        ("field", "env_name"),
+        [
+            ("aws_max_pool_connections", "RENTIVO_AWS_MAX_POOL_CONNECTIONS"),
+            ("kms_max_in_flight", "RENTIVO_KMS_MAX_IN_FLIGHT"),
+        ],
+    )
+    def test_rejects_zero(self, field, env_name):
+        with pytest.raises(ValidationError) as exc:
+            Settings(_env_file=None, **{field: 0})
+        assert env_name in str(exc.value)
+
+
 def test_google_auth_defaults():
     s = Settings(_env_file=None)
     assert s.google_auth_enabled is False